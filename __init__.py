@@ -3,6 +3,7 @@ from sys import path
 
 path.insert(0, dirname(__file__))  # noqa
 
+from .asyncfunctions import *
 from .boolobject import Bool
 from .dictobject import Dict
 from .frozensetobject import Frozenset
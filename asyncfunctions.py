@@ -0,0 +1,310 @@
+"""This Module re-implements Map, Filter, Zip, Enumerate and Sorted
+of the functions module as their asyncio counterparts. They accept
+async iterables as well as plain ones, and functions returning
+awaitables (e.g. coroutine functions) as well as plain functions.
+
+"""
+
+import asyncio
+from inspect import isawaitable
+from typing import Any as AnyType
+from typing import (AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Generic, Iterable, Self, TypeVar)
+
+from _types import check_type
+from functions import Sorted, strict_zip_error
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+# List of all async functions written within this module.
+__all__ = ["AMap", "AFilter", "AZip", "AEnumerate", "ASorted"]
+
+
+async def iter_sync(iterable: Iterable[T], /) -> AsyncIterator[T]:
+    "Yield the items of a plain iterable asynchronously."
+
+    for item in iterable:
+        yield item
+
+
+def to_aiter(iterable: AsyncIterable[T] | Iterable[T], /) -> AsyncIterator[T]:
+    "Return an async iterator over an async or a plain iterable."
+
+    if hasattr(iterable, '__aiter__'):
+        return iterable.__aiter__()  # type: ignore
+    if hasattr(iterable, '__iter__'):
+        return iter_sync(iterable)  # type: ignore
+    raise TypeError(
+        f"{type(iterable).__name__!r} object is not iterable")
+
+
+async def maybe_await(value: Awaitable[T] | T, /) -> T:
+    "Return value, awaiting it first if it's awaitable."
+
+    if isawaitable(value):
+        return await value
+    return value  # type: ignore
+
+
+class AEnumerate(Generic[T]):
+    """Return an AEnumerate object.
+
+    iterable
+        an object supporting iteration or async iteration
+
+    The async counterpart of Enumerate, yields pairs containing a count
+    (from start, which defaults to zero) and a value yielded by the iterable.
+    """
+
+    def __init__(self, /, iterable: AsyncIterable[T] | Iterable[T], start: int = 0) -> None:
+        if not isinstance(start, int):  # type: ignore
+            raise TypeError(
+                f"{type(start).__name__!r} object cannot be interpreted as an integer")
+
+        self.__index = start
+        self.__iter = to_aiter(iterable)
+
+    def __aiter__(self, /) -> Self:
+        return self
+
+    async def __anext__(self, /) -> tuple[int, T]:
+        item = await self.__iter.__anext__()
+        index = self.__index
+        self.__index += 1
+        return (index, item)
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+
+class AFilter(Generic[T]):
+    """AFilter(function or None, iterable) --> AFilter object
+
+    Return an async iterator yielding those items of iterable for which
+    function(item), awaited if it returns an awaitable, is true.
+    If function is None, return the items that are true.
+    """
+
+    def __init__(self, /, function: Callable[[T], AnyType] | None, iterable: AsyncIterable[T] | Iterable[T]):
+        self.__func = function
+        self.__iter = to_aiter(iterable)
+
+    def __aiter__(self, /) -> Self:
+        return self
+
+    async def __anext__(self, /) -> T:
+        function = self.__func
+        async for item in self.__iter:
+            if function is None:
+                if item:
+                    return item
+            elif await maybe_await(function(item)):
+                return item
+        raise StopAsyncIteration
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+
+class AZip(Generic[T]):
+    """AZip(*iterables, strict=False) --> Yield tuples until an input is exhausted.
+
+    The async counterpart of Zip, the i-th element in every tuple comes
+    from the i-th iterable argument. This continues until the shortest
+    argument is exhausted.
+
+    If strict is true and one of the arguments is exhausted before the others,
+    raise a ValueError.
+    """
+
+    def __init__(self, /, *args: AsyncIterable[T] | Iterable[T], strict: bool = False) -> None:
+        self.__strict = strict
+        self.__iters = [to_aiter(i) for i in args]
+
+    def __aiter__(self, /) -> Self:
+        return self
+
+    async def __anext__(self, /) -> tuple[T, ...]:
+        if not self.__iters:
+            raise StopAsyncIteration
+
+        items: list[T] = []
+        for pos, it in enumerate(self.__iters):
+            try:
+                items.append(await it.__anext__())
+            except StopAsyncIteration:
+                iters, self.__iters = self.__iters, []
+                if self.__strict:
+                    await self.__check_exhausted(iters, pos)
+                raise
+        return tuple(items)
+
+    async def __check_exhausted(self, iters: list[AsyncIterator[T]], pos: int, /) -> None:
+        "Raise ValueError unless all iterators are exhausted along with iters[pos]."
+
+        name = self.__class__.__name__
+        if pos:
+            raise strict_zip_error(name, pos, longer=False)
+
+        for pos, it in enumerate(iters[1:], start=1):
+            try:
+                await it.__anext__()
+            except StopAsyncIteration:
+                continue
+            raise strict_zip_error(name, pos, longer=True)
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+
+class AMap(Generic[R, T]):
+    """make an async iterator that computes the function using arguments from
+
+    each of the iterables. stops when the shortest iterable is exhausted.
+
+    The calls run concurrently as tasks, at most limit (default 16) of them
+    are running or holding a result not yet consumed, which a semaphore and
+    a bounded queue enforce, so the iterables are consumed lazily. Results
+    come in input order unless ordered is false, in which case they come as
+    they complete. An exception raised by a call is raised when its result
+    is reached. Call aclose() when stopping before the end.
+    """
+
+    def __init__(self, /, func: Callable[..., Awaitable[R] | R], *args: AsyncIterable[T] | Iterable[T],
+                 limit: int = 16, ordered: bool = True) -> None:
+        if not args:
+            raise TypeError(
+                f"{self.__class__.__name__}() must have at least two arguments.")
+
+        check_type("'%s' object cannot be interpreted as an integer", [limit, int])
+        if limit < 1:
+            raise ValueError("limit must be greater than 0")
+
+        self.__func = func
+        self.__iters = [to_aiter(i) for i in args]
+        self.__limit = limit
+        self.__ordered = ordered
+        self.__producer: asyncio.Task[None] | None = None
+        self.__tasks: set[asyncio.Future[R]] = set()
+        self.__error: BaseException | None = None
+        self.__closed = False
+
+    def __aiter__(self, /) -> Self:
+        return self
+
+    async def __anext__(self, /) -> R:
+        if self.__producer is None:
+            if self.__closed:
+                raise StopAsyncIteration
+            # created here, they need the running event loop, and the
+            # queue holds at most limit results plus the end marker
+            self.__semaphore = asyncio.Semaphore(self.__limit)
+            self.__queue: asyncio.Queue[asyncio.Future[R] | None] = asyncio.Queue(self.__limit + 1)
+            self.__producer = asyncio.ensure_future(self.__produce())
+
+        task = await self.__queue.get()
+        if task is None:
+            self.__queue.put_nowait(None)  # stay exhausted
+            if self.__error is not None:
+                error, self.__error = self.__error, None
+                raise error
+            raise StopAsyncIteration
+
+        try:
+            return await task
+        except BaseException:
+            await self.aclose()
+            raise
+        finally:
+            self.__semaphore.release()
+
+    async def __produce(self, /) -> None:
+        "Start a task for each set of arguments while the limit allows it."
+
+        queue, semaphore, tasks = self.__queue, self.__semaphore, self.__tasks
+        try:
+            while True:
+                args: list[T] = []
+                for it in self.__iters:
+                    try:
+                        args.append(await it.__anext__())
+                    except StopAsyncIteration:
+                        break
+                else:
+                    await semaphore.acquire()
+                    task = asyncio.ensure_future(self.__call(args))
+                    if self.__ordered:
+                        queue.put_nowait(task)
+                    else:
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                        task.add_done_callback(queue.put_nowait)
+                    continue
+                break
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            self.__error = error
+
+        # unordered results are queued as their calls complete
+        if tasks:
+            await asyncio.wait(set(tasks))
+        queue.put_nowait(None)
+
+    async def __call(self, args: list[T], /) -> R:
+        return await maybe_await(self.__func(*args))
+
+    async def aclose(self, /) -> None:
+        "Cancel the calls still running and stop iterating."
+
+        self.__closed = True
+        producer = self.__producer
+        if producer is None:
+            return
+        if not producer.done():
+            producer.cancel()
+
+        queue = self.__queue
+        for task in self.__tasks:
+            # cancelled unordered calls mustn't be queued after the end marker
+            task.remove_done_callback(queue.put_nowait)
+            task.cancel()
+        self.__tasks.clear()
+        while not queue.empty():
+            task = queue.get_nowait()
+            if task is not None:
+                task.cancel()
+        queue.put_nowait(None)
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+
+async def ASorted(iterable: AsyncIterable[T] | Iterable[T], /, *,
+                  key: Callable[[T], AnyType] | None = None, reverse: bool = False) -> list[T]:
+    """Return a new list containing all items from the iterable in ascending order.
+
+    The async counterpart of Sorted, key may also return an awaitable,
+    which is awaited once for every item.
+    """
+    items = [item async for item in to_aiter(iterable)]
+    if key is None:
+        return Sorted(items, reverse=reverse)
+
+    keys = [await maybe_await(key(item)) for item in items]
+    order = Sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    return [items[idx] for idx in order]
@@ -0,0 +1,56 @@
+"""Benchmark Bin, Oct, Hex and ToBase of the functions module against
+the builtins bin, oct, hex and str on random ints from 1 to 1M bits.
+
+Run it from the repository root:
+
+    python benchmarks/base_conversion.py
+
+"""
+
+import random
+import sys
+from os.path import dirname
+from timeit import Timer
+
+sys.path.insert(0, dirname(dirname(__file__)))  # noqa
+
+from functions import Bin, Hex, Oct, ToBase  # noqa: E402
+
+# Bit lengths of the ints converted.
+SIZES = (1, 64, 1_000, 10_000, 100_000, 1_000_000)
+
+# (name, builtin, imitation) pairs compared.
+CASES = (
+    ("bin", bin, Bin),
+    ("oct", oct, Oct),
+    ("hex", hex, Hex),
+    ("base 10", str, lambda number: ToBase(number, 10)),
+)
+
+
+def best_time(func, number: int) -> float:
+    "Return the best time of a single call of func(number) out of a few runs."
+
+    timer = Timer(lambda: func(number))
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=loops)) / loops
+
+
+def main() -> None:
+    # str() refuses huge ints unless the conversion limit is lifted
+    sys.set_int_max_str_digits(0)
+    random.seed(0)
+
+    print(f"{'bits':>9} {'case':>8} {'builtin':>10} {'functions':>10} {'ratio':>7}")
+    for bits in SIZES:
+        number = random.getrandbits(bits) | 1 << (bits - 1)
+        for name, builtin, imitation in CASES:
+            if imitation(number) != builtin(number):
+                raise AssertionError(f"{name} differs for a {bits}-bit int")
+            expected = best_time(builtin, number)
+            actual = best_time(imitation, number)
+            print(f"{bits:>9} {name:>8} {expected:>10.2e} {actual:>10.2e} {actual / expected:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,28 @@ imitate those functions, not intended to be used in the programs.
 
 """
 
+import heapq
+import pickle
+from array import array
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Executor, Future,
+                                ProcessPoolExecutor, ThreadPoolExecutor, wait)
+from functools import partial
+from itertools import chain, islice, repeat
+from math import fsum, isfinite
+from operator import floordiv, itemgetter, mod
+from os import cpu_count
+from sys import byteorder, getsizeof
+from tempfile import TemporaryFile
 from typing import Any as AnyType
 from typing import (Callable, Generic, Iterable, Iterator, Optional, Self,
                     Sequence, Sized, TypeVar, Union)
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, it only adds fast paths
+    numpy = None
+
 from _types import NumberType, SupportsLenAndGetItem, check_type
 
 T = TypeVar('T')
@@ -17,7 +35,7 @@ R = TypeVar('R')
 
 # List of all built_in functions written within this module
 # Functions name have been capitalized to prevent conflict.
-__all__ = ["Any", "All", "Chr", "Ord", "Bin",
+__all__ = ["Any", "All", "Chr", "Ord", "Bin", "Oct", "Hex",
            "Divmod", "Len", "Min", "Max", "Sum", "Sorted",
            "Map", "Zip", "Filter", "Enumerate", "Reversed"]
 
@@ -58,6 +76,12 @@ digits = {48: '0', 49: '1', 50: '2', 51: '3', 52: '4',
 # These are some ascii characters of python representing themselves in dict{key: value} pairs.
 all_ascii_characters = ascii_lowercase | ascii_uppercase | whitespace | digits | punctuation
 
+# Every code point is one 4 byte unit in UTF-32, so converting between
+# characters and code points is a plain byte copy in native byte order.
+# surrogatepass lets lone surrogates through, as chr() and ord() do.
+UTF32 = 'utf-32-le' if byteorder == 'little' else 'utf-32-be'
+MAX_CODE_POINT = 0x10FFFF
+
 # for checking missing arguments
 MISSING = object()
 
@@ -72,21 +96,15 @@ def is_iter(value: AnyType, /) -> bool:
         return False
 
 
-def getkey(dct: dict[int, str], value: str) -> int:
-    "Return key for the value."
-
-    for key, item in dct.items():
-        if value == item:
-            return key
-    raise KeyError(f"key not found for '{value}'")
-
-
 def Chr(i: int, /) -> str:
-    "Return a Unicode string of one character"
+    "Return a Unicode string of one character with ordinal 0 <= i <= 0x10ffff."
 
     check_type("'%s' object cannot be interpreted as an integer", [i, int])
 
-    return all_ascii_characters[i]
+    if not 0 <= i <= MAX_CODE_POINT:
+        raise ValueError("Chr() arg not in range(0x110000)")
+
+    return i.to_bytes(4, byteorder).decode(UTF32, 'surrogatepass')
 
 
 def Ord(c: str, /) -> int:
@@ -94,11 +112,45 @@ def Ord(c: str, /) -> int:
 
     check_type("Ord() expected string of length 1, but %s found", [c, str])
 
-    if len(c) > 1:
+    if len(c) != 1:
         raise TypeError(
             f"Ord() expected a character, but string of length {len(c)} found")
 
-    return getkey(all_ascii_characters, c)
+    return int.from_bytes(c.encode(UTF32, 'surrogatepass'), byteorder)
+
+
+__all__.extend(["Chrs", "Ords"])
+
+# * Note: `Chrs` and `Ords` aren't python built-in functions,
+# they're Chr and Ord over whole strings at once.
+def Chrs(iterable: Iterable[int], /) -> str:
+    """Return the string of the characters with the code points of the iterable.
+
+    The code points are packed into an array.array('I'), which an
+    array.array('I') input already is, and decoded in one go.
+    """
+    if isinstance(iterable, array) and iterable.typecode == 'I':
+        codes = iterable
+    else:
+        try:
+            codes = array('I', iterable)
+        except OverflowError:
+            raise ValueError("Chrs() arg not in range(0x110000)") from None
+
+    if codes and max(codes) > MAX_CODE_POINT:
+        raise ValueError("Chrs() arg not in range(0x110000)")
+
+    return codes.tobytes().decode(UTF32, 'surrogatepass')
+
+
+def Ords(string: str, /) -> array:
+    "Return an array.array('I') of the Unicode code points of the string."
+
+    check_type("Ords() argument must be str, not %s", [string, str])
+
+    codes = array('I')
+    codes.frombytes(string.encode(UTF32, 'surrogatepass'))
+    return codes
 
 
 def Any(iterable: Iterable[object], /) -> bool:
@@ -133,6 +185,100 @@ def All(iterable: Iterable[object], /) -> bool:
     return True
 
 
+# Digits of bases up to 36.
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def make_byte_digits(bits: int) -> tuple[str, ...]:
+    "Return the digits of every byte in base 2**bits, for bits dividing 8."
+
+    mask = (1 << bits) - 1
+    return tuple(
+        ''.join(DIGITS[byte >> shift & mask] for shift in range(8 - bits, -1, -bits))
+        for byte in range(256))
+
+
+# The digits of each byte in bases 2, 4 and 16, indexed by bits per digit.
+byte_digits = {bits: make_byte_digits(bits) for bits in (1, 2, 4)}
+
+# The digit of each group of bits in bases 8 and 32, indexed by bits per digit.
+group_digits = {bits: {''.join(DIGITS[value >> shift & 1] for shift in range(bits - 1, -1, -1)): DIGITS[value]
+                       for value in range(1 << bits)}
+                for bits in (3, 5)}
+
+# Numbers with fewer digits than this are converted digit by digit.
+DIGIT_SPLIT_THRESHOLD = 64
+
+
+def pow2_digits(num: int, bits: int) -> str:
+    "Return the digits of a positive int in base 2**bits, in linear time."
+
+    if bits in byte_digits:
+        # every byte is a fixed number of digits, looked up in a table
+        data = num.to_bytes((num.bit_length() + 7) // 8, 'big')
+        return ''.join(map(byte_digits[bits].__getitem__, data)).lstrip('0')
+
+    binary = pow2_digits(num, 1)
+    binary = '0' * (-len(binary) % bits) + binary
+    table = group_digits[bits]
+    return ''.join([table[binary[i: i + bits]] for i in range(0, len(binary), bits)])
+
+
+def small_digits(num: int, base: int, width: int) -> str:
+    "Return the digits of a non-negative int in base, zero padded to width."
+
+    digits: list[str] = []
+    while num:
+        num, remainder = divmod(num, base)
+        digits.append(DIGITS[remainder])
+    digits.extend('0' * (width - len(digits)))
+    return ''.join(reversed(digits))
+
+
+def split_digits(num: int, base: int) -> str:
+    """Return the digits of a positive int in base.
+
+    The number is split in halves by the powers base**(2**i), so that every
+    divmod works on numbers of similar size, instead of peeling off one
+    digit at a time with a division of the whole number.
+    """
+    # powers[i] is base**(2**i), up to the first one above num
+    powers = [base]
+    while powers[-1] <= num:
+        powers.append(powers[-1] * powers[-1])
+
+    parts: list[str] = []
+
+    def convert(num: int, i: int, width: int) -> None:
+        # num < powers[i + 1], its low half is 2**i digits wide
+        if i < 0 or 2 << i <= DIGIT_SPLIT_THRESHOLD:
+            parts.append(small_digits(num, base, width))
+            return
+        high, low = divmod(num, powers[i])
+        if not high and width <= 1 << i:
+            # no digits above the low half, and none needed for padding
+            convert(low, i - 1, width)
+            return
+        convert(high, i - 1, max(width - (1 << i), 0))
+        convert(low, i - 1, 1 << i)
+
+    convert(num, len(powers) - 2, 0)
+    return ''.join(parts)
+
+
+def to_base(number: int, base: int, prefix: str) -> str:
+    "Return the digits of number in base after its sign and prefix."
+
+    num = -number if number < 0 else number
+    if not num:
+        digits = '0'
+    elif base & (base - 1) == 0:
+        digits = pow2_digits(num, base.bit_length() - 1)
+    else:
+        digits = split_digits(num, base)
+    return f"{'-' if number < 0 else ''}{prefix}{digits}"
+
+
 def Bin(number: int, /) -> str:
     """Return the binary representation of an integer.
 
@@ -142,24 +288,99 @@ def Bin(number: int, /) -> str:
     check_type(
         "'%s' object cannot be interpreted as an integer", [number, int])
 
-    if number == 0:
-        return "0b0"
-    num: int = abs(number)
+    return to_base(number, 2, '0b')
 
-    binary: str = ""
-    while num != 0:
-        remainder = num % 2
-        binary += str(remainder)
-        num //= 2
 
-    if number > -1:
-        return f"0b{binary[::-1]}"
-    else:
-        return f"-0b{binary[::-1]}"
+def Oct(number: int, /) -> str:
+    """Return the octal representation of an integer.
+
+    >>> oct(342391)
+    '0o1234567'
+    """
+    check_type(
+        "'%s' object cannot be interpreted as an integer", [number, int])
+
+    return to_base(number, 8, '0o')
+
+
+def Hex(number: int, /) -> str:
+    """Return the hexadecimal representation of an integer.
+
+    >>> hex(12648430)
+    '0xc0ffee'
+    """
+    check_type(
+        "'%s' object cannot be interpreted as an integer", [number, int])
+
+    return to_base(number, 16, '0x')
+
+
+__all__.append("ToBase")
+
+# * Note: `ToBase` isn't a python built-in function, it's the
+# inverse of int(string, base) for bases 2 through 36.
+def ToBase(number: int, base: int, /) -> str:
+    """Return the representation of an integer in base, without a prefix.
+
+    >>> ToBase(255, 36)
+    '73'
+    """
+    check_type(
+        "'%s' object cannot be interpreted as an integer", [number, int], [base, int])
+
+    if not 2 <= base <= 36:
+        raise ValueError("ToBase() base must be >= 2 and <= 36")
+
+    return to_base(number, base, '')
+
+
+def divmod_arrays(x: AnyType, y: AnyType, /) -> tuple[array, array]:
+    "Return Divmod of each pair of items of x and y as two array.array, a number is repeated."
+
+    operands: list[AnyType] = []
+    is_float = False
+    for value in (x, y):
+        typed = typed_buffer(value)
+        if typed is None:
+            check_type("unsupported operand type for Divmod(): '%s'", [value, (int, float)])
+            is_float = is_float or isinstance(value, float)
+            operands.append(repeat(value))
+        else:
+            is_float = is_float or typed[1]
+            operands.append(value)
+
+    if not isinstance(operands[0], repeat) and not isinstance(operands[1], repeat) and len(x) != len(y):
+        raise ValueError(
+            f"Divmod() operands have different lengths {len(x)} and {len(y)}")
+
+    # map runs each operator over the items natively, which is
+    # quicker than dividing pair by pair in a Python loop
+    typecode = 'd' if is_float else 'q'
+    try:
+        return (array(typecode, map(floordiv, *operands)),
+                array(typecode, map(mod, *operands)))
+    except OverflowError:
+        if is_float:
+            raise
+        # only non-negative results too big for 'q' can still fit
+        return (array('Q', map(floordiv, *operands)),
+                array('Q', map(mod, *operands)))
 
 
 def Divmod(x: NumberType, y: NumberType, /) -> tuple[NumberType, NumberType]:
-    "Return the tuple (x//y, x%y).  Invariant: div*y + mod == x."
+    """Return the tuple (x//y, x%y).  Invariant: div*y + mod == x.
+
+    If x or y is an array.array or a 1-D memoryview of C numbers, the other
+    one is a number or an array of the same length, and the result is a
+    pair of array.array of floats ('d') or integers ('q'). If x or y is a
+    NumPy array, numpy.divmod broadcasts them instead. Either way the
+    quotients are floored, as for numbers.
+    """
+    if numpy is not None and (isinstance(x, numpy.ndarray) or isinstance(y, numpy.ndarray)):
+        return numpy.divmod(x, y)
+
+    if typed_buffer(x) is not None or typed_buffer(y) is not None:
+        return divmod_arrays(x, y)  # type: ignore
 
     return (x // y, x % y)
 
@@ -174,6 +395,25 @@ def Len(obj: Sized, /) -> int:
         f"object of type {type(obj).__name__!r} has no Len()")
 
 
+def native_extreme(iterable: AnyType, largest: bool, /) -> AnyType:
+    """Return the smallest or largest item of a non-empty array.array, 1-D
+    memoryview or NumPy array of numbers, found natively. Return MISSING for
+    other inputs.
+    """
+    if typed_buffer(iterable) is not None:
+        if not len(iterable):
+            return MISSING
+        return max(iterable) if largest else min(iterable)
+
+    if (numpy is not None and isinstance(iterable, numpy.ndarray) and iterable.ndim == 1
+            and iterable.size and iterable.dtype.kind in 'biuf'):
+        value = iterable.max() if largest else iterable.min()
+        # NumPy propagates NaN, the comparisons of Min and Max skip it
+        if value == value:
+            return value
+    return MISSING
+
+
 def Min(*args: Union[T, Iterable[T]], default: T | object = MISSING, key: Optional[Callable[[T], AnyType]] = None) -> T:
     """With a single iterable argument, return its smallest item.
     The default keyword-only argument specifies an object to return
@@ -188,25 +428,34 @@ def Min(*args: Union[T, Iterable[T]], default: T | object = MISSING, key: Option
         if not is_iter(val):
             raise TypeError(f"{type(val).__name__!r} object is not iterable")
 
-        if not val:  # checking for empty sequence
-            if default is not MISSING:
-                return default  # type: ignore
-            raise ValueError("Min() arg is an empty sequence")
+        if key is None:
+            small = native_extreme(val, False)
+            if small is not MISSING:
+                return small
 
         it = iter(val)  # type: ignore
     else:
+        if default is not MISSING:
+            raise TypeError(
+                "Cannot specify a default for Min() with multiple positional arguments")
         it = iter(args)
 
-    if key is None:
-        def key(x: T) -> T:
-            return x
-
-    small = next(it)  # type: ignore
-    small_key: AnyType = key(small)
-
     item: AnyType
     it: Iterator[AnyType]
 
+    small = next(it, MISSING)
+    if small is MISSING:  # checking for empty iterable
+        if default is not MISSING:
+            return default  # type: ignore
+        raise ValueError("Min() arg is an empty sequence")
+
+    if key is None:
+        for item in it:
+            if item < small:
+                small = item
+        return small
+
+    small_key: AnyType = key(small)
     for item in it:
         i = key(item)
         if i < small_key:
@@ -230,25 +479,34 @@ def Max(*args: Union[T, Iterable[T]], default: T | object = MISSING, key: Option
             raise TypeError(
                 f"{type(val).__name__!r} object is not iterable")
 
-        if not val:  # checking for empty sequence
-            if default is not MISSING:
-                return default  # type: ignore
-            raise ValueError("Max() arg is an empty sequence")
+        if key is None:
+            big = native_extreme(val, True)
+            if big is not MISSING:
+                return big
 
         it = iter(val)  # type: ignore
     else:
+        if default is not MISSING:
+            raise TypeError(
+                "Cannot specify a default for Max() with multiple positional arguments")
         it = iter(args)
 
-    if key is None:
-        def key(x: T) -> T:
-            return x
-
-    big = next(it)  # type: ignore
-    big_key: AnyType = key(big)
-
     item: AnyType
     it: Iterator[AnyType]
 
+    big = next(it, MISSING)
+    if big is MISSING:  # checking for empty iterable
+        if default is not MISSING:
+            return default  # type: ignore
+        raise ValueError("Max() arg is an empty sequence")
+
+    if key is None:
+        for item in it:
+            if item > big:
+                big = item
+        return big
+
+    big_key: AnyType = key(big)
     for item in it:
         i = key(item)
         if i > big_key:
@@ -257,11 +515,251 @@ def Max(*args: Union[T, Iterable[T]], default: T | object = MISSING, key: Option
     return big
 
 
-def Sum(iterable: Iterable[NumberType], /, start: int = 0) -> NumberType:
+__all__.append("MinMax")
+
+# * Note: `MinMax` isn't a python built-in function, it's
+# (Min(iterable), Max(iterable)) found in a single pass.
+def MinMax(iterable: Iterable[T], /, *, default: AnyType = MISSING,
+           key: Optional[Callable[[T], AnyType]] = None) -> tuple[T, T]:
+    """Return a tuple of the smallest and the biggest item of the iterable.
+
+    The items are compared in pairs, first with each other and then the
+    smaller one with the smallest and the bigger one with the biggest so
+    far, about 1.5 comparisons per item instead of 2. Ties are resolved as
+    in Min and Max. The default keyword-only argument specifies an object
+    to return if the provided iterable is empty.
+    """
+    if not is_iter(iterable):
+        raise TypeError(
+            f"{type(iterable).__name__!r} object is not iterable")
+
+    if key is None:
+        small = native_extreme(iterable, False)
+        if small is not MISSING:
+            return (small, native_extreme(iterable, True))
+
+    it = iter(iterable)
+    small = next(it, MISSING)
+    if small is MISSING:  # checking for empty iterable
+        if default is not MISSING:
+            return default
+        raise ValueError("MinMax() arg is an empty sequence")
+
+    big = small
+    small_key = big_key = small if key is None else key(small)
+    for a in it:
+        a_key = a if key is None else key(a)
+        b = next(it, MISSING)
+        if b is MISSING:
+            if a_key < small_key:
+                small = a
+            elif a_key > big_key:
+                big = a
+            break
+
+        b_key = b if key is None else key(b)
+        if b_key < a_key:
+            if b_key < small_key:
+                small, small_key = b, b_key
+            if a_key > big_key:
+                big, big_key = a, a_key
+        else:
+            if a_key < small_key:
+                small, small_key = a, a_key
+            if b_key > big_key:
+                # on a tie the earlier item is the biggest, as in Max
+                big, big_key = (b, b_key) if a_key < b_key else (a, a_key)
+    return (small, big)
+
+
+__all__.extend(["Nsmallest", "Nlargest", "TopK"])
+
+# * Note: `Nsmallest`, `Nlargest` and `TopK` aren't python built-in functions,
+# they're the partial sorts of heapq.nsmallest and heapq.nlargest.
+
+
+class ReversedOrder:
+    "Wrap a value so that it compares in reverse, turning a min-heap into a max-heap."
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: AnyType, /) -> None:
+        self.value = value
+
+    def __lt__(self, other: Self, /) -> bool:
+        return other.value < self.value
+
+
+class TopK(Generic[T]):
+    """TopK(n, *, key=None, largest=False) --> TopK object
+
+    Keep the n smallest items pushed so far, or the n largest if largest
+    is true, in a bounded heap. Pushing an item costs O(log n) and only
+    n items are held in memory, so it can follow an endless stream.
+
+    Items with equal keys are ranked in the order they were pushed, so
+    items() always equals Sorted(pushed, key=key, reverse=largest)[:n].
+    """
+
+    def __init__(self, n: int, /, *, key: Callable[[T], AnyType] | None = None, largest: bool = False) -> None:
+        check_type("'%s' object cannot be interpreted as an integer", [n, int])
+
+        self.__n = n
+        self.__key = key
+        self.__largest = largest
+        self.__count = 0
+        # (ReversedOrder((key, count)), item) entries for the n smallest items,
+        # ((key, -count), item) entries for the n largest, worst at heap[0]
+        self.__heap: list[tuple[AnyType, T]] = []
+
+    def __len__(self, /) -> int:
+        return len(self.__heap)
+
+    def __iter__(self, /) -> Iterator[T]:
+        return iter(self.items())
+
+    def __repr__(self, /) -> str:
+        return f"{self.__class__.__name__}({self.items()!r})"
+
+    @property
+    def count(self, /) -> int:
+        "Number of items pushed so far."
+
+        return self.__count
+
+    def push(self, item: T, /) -> None:
+        "Push item, keeping it if it ranks among the top n items so far."
+
+        self.__count += 1
+        heap, n = self.__heap, self.__n
+        if n <= 0:
+            return
+
+        key = item if self.__key is None else self.__key(item)
+        if self.__largest:
+            if len(heap) < n:
+                heapq.heappush(heap, ((key, -self.__count), item))
+            elif heap[0][0][0] < key:
+                heapq.heapreplace(heap, ((key, -self.__count), item))
+        else:
+            if len(heap) < n:
+                heapq.heappush(heap, (ReversedOrder((key, self.__count)), item))
+            elif key < heap[0][0].value[0]:
+                heapq.heapreplace(heap, (ReversedOrder((key, self.__count)), item))
+
+    def extend(self, iterable: Iterable[T], /) -> None:
+        "Push every item of iterable."
+
+        for item in iterable:
+            self.push(item)
+
+    def items(self, /) -> list[T]:
+        "Return the top n items so far, best first."
+
+        if self.__largest:
+            entries = Sorted(self.__heap, key=itemgetter(0), reverse=True)
+        else:
+            entries = Sorted(self.__heap, key=lambda entry: entry[0].value)
+        return [item for _, item in entries]
+
+
+def nselect(name: str, n: int, iterable: Iterable[T], key: Callable[[T], AnyType] | None,
+            default: AnyType, largest: bool) -> list[T]:
+    "Shared implementation of Nsmallest and Nlargest."
+
+    check_type("'%s' object cannot be interpreted as an integer", [n, int])
+    if not is_iter(iterable):
+        raise TypeError(f"{type(iterable).__name__!r} object is not iterable")
+
+    top = TopK(n, key=key, largest=largest)
+    top.extend(iterable)
+    if not top.count:
+        if default is not MISSING:
+            return default
+        raise ValueError(f"{name}() arg is an empty sequence")
+    return top.items()
+
+
+def Nsmallest(n: int, iterable: Iterable[T], /, *, key: Optional[Callable[[T], AnyType]] = None,
+              default: T | object = MISSING) -> list[T]:
+    """Return a list with the n smallest items of the iterable, smallest first.
+
+    Equivalent to Sorted(iterable, key=key)[:n], but it holds only n items
+    in a bounded heap, costing O(len(iterable) * log(n)).
+    The default keyword-only argument specifies an object to return
+    if the provided iterable is empty.
+    """
+    return nselect("Nsmallest", n, iterable, key, default, largest=False)
+
+
+def Nlargest(n: int, iterable: Iterable[T], /, *, key: Optional[Callable[[T], AnyType]] = None,
+             default: T | object = MISSING) -> list[T]:
+    """Return a list with the n largest items of the iterable, largest first.
+
+    Equivalent to Sorted(iterable, key=key, reverse=True)[:n], but it holds
+    only n items in a bounded heap, costing O(len(iterable) * log(n)).
+    The default keyword-only argument specifies an object to return
+    if the provided iterable is empty.
+    """
+    return nselect("Nlargest", n, iterable, key, default, largest=True)
+
+
+# Typecodes and memoryview formats holding C integers or floats.
+INTEGER_FORMATS = frozenset('bBhHiIlLqQnN')
+FLOAT_FORMATS = frozenset('fde')
+
+
+def typed_buffer(iterable: AnyType, /) -> tuple[AnyType, bool] | None:
+    """Return (buffer, is_float) if iterable is an array.array or a 1-D
+    memoryview of C numbers, else None.
+    """
+    if isinstance(iterable, array):
+        code = iterable.typecode
+    elif isinstance(iterable, memoryview) and iterable.ndim == 1:
+        code = iterable.format
+    else:
+        return None
+
+    if code in INTEGER_FORMATS:
+        return (iterable, False)
+    if code in FLOAT_FORMATS:
+        return (iterable, True)
+    return None
+
+
+def compensated_sum(iterable: Iterable[NumberType], start: NumberType) -> NumberType:
+    "Return start plus the items of iterable, using Neumaier's compensated summation for floats."
+
+    total = start
+    compensation = 0
+    for item in iterable:
+        value = total + item
+        if isinstance(value, float):
+            # the low-order bits lost by the addition, taken from the smaller operand
+            if abs(total) >= abs(item):
+                compensation += (total - value) + item
+            else:
+                compensation += (item - value) + total
+        total = value
+
+    if compensation and isfinite(compensation):
+        total += compensation
+    return total
+
+
+def Sum(iterable: Iterable[NumberType], /, start: int = 0, *, precise: bool = False,
+        chunksize: int | None = None) -> NumberType:
     """Return the sum of a 'start' value (default: 0) plus an iterable of numbers
     When the iterable is empty, return the start value.
     This function is intended specifically for use with numeric values and may
     reject non-numeric types.
+
+    array.array, 1-D memoryview of C numbers and NumPy array inputs are summed
+    natively, NumPy's fixed width integers wrap around on overflow as in NumPy.
+    If precise is true, floats are summed without accumulating rounding errors,
+    exactly for typed float inputs and by Neumaier's compensated summation
+    otherwise. If chunksize is given, other iterables are consumed and summed
+    natively chunksize items at a time, still adding from left to right.
     """
     if not is_iter(iterable):
         raise TypeError(
@@ -271,87 +769,521 @@ def Sum(iterable: Iterable[NumberType], /, start: int = 0) -> NumberType:
         raise TypeError(
             "Sum() can't sum strings [use ''.join(seq) instead]")
 
-    output = 0
+    typed = typed_buffer(iterable)
+    if typed is not None:
+        buffer, is_float = typed
+        if precise and is_float:
+            return fsum(chain((start,), buffer))
+        return sum(buffer, start)
+
+    if numpy is not None and isinstance(iterable, numpy.ndarray) and iterable.ndim:
+        if precise and iterable.ndim == 1 and iterable.dtype.kind == 'f':
+            return fsum(chain((start,), iterable.tolist()))
+        return start + iterable.sum(axis=0)
+
+    if precise:
+        if chunksize is not None:
+            raise ValueError("Sum() can't use chunksize and precise together")
+        return compensated_sum(iterable, start)
+
+    output = start
+    if chunksize is not None:
+        # the running total is each chunk's start, so the order of additions is kept
+        for chunk in Batched(iterable, chunksize):
+            output = sum(chunk, output)
+        return output
+
+    # not +=, which would extend a mutable start such as a list in place
     for item in iterable:
-        output += item
-    return output + start
+        output = output + item
+    return output
 
 
-def binary_search(array: list[AnyType], item: AnyType, start: int, end: int) -> int:
-    if start == end:
-        if array[start] > item:
-            return start
-        else:
-            return start + 1
-    if start > end:
-        return start
+# * Note: This is pythonic implementation of CPython's timsort algorithm,
+# see Objects/listsort.txt in the CPython sources for a full description.
+
+# Runs must win this many times in a row before galloping is tried.
+MIN_GALLOP = 7
+
+
+def compute_minrun(n: int) -> int:
+    """Return the minimum run length for an array of length n.
+
+    Natural runs shorter than this are extended with binary insertion,
+    the result lies in 32..64 so that n / minrun is close to a power of 2.
+    """
+    r = 0  # becomes 1 if any bits are shifted off
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
 
-    mid = round((start + end) / 2)
+def count_run(array: list[AnyType], lo: int, hi: int) -> int:
+    """Return the length of the run beginning at array[lo].
 
-    if array[mid] < item:
-        return binary_search(array, item, mid + 1, end)
-    elif array[mid] > item:
-        return binary_search(array, item, start, mid - 1)
+    A run is either non-descending or strictly descending, strictly
+    descending runs are reversed in place so the result is always ascending.
+    """
+    n = lo + 1
+    if n == hi:
+        return 1
+
+    if array[n] < array[lo]:
+        n += 1
+        while n < hi and array[n] < array[n - 1]:
+            n += 1
+        array[lo: n] = array[lo: n][::-1]
     else:
-        return mid
+        n += 1
+        while n < hi and not array[n] < array[n - 1]:
+            n += 1
+    return n - lo
 
 
-# * Insertion sort is used by timsort for small array or small runs.
-def insertion_sort(array: list[AnyType]) -> list[AnyType]:
-    for index in range(1, len(array)):
-        value = array[index]
-        pos = binary_search(array, value, 0, index - 1)
-        array = array[:pos] + [value] + array[pos:index] + array[index + 1:]
-    return array
+def binary_insertion_sort(array: list[AnyType], lo: int, hi: int, start: int) -> None:
+    """Sort array[lo:hi] in place, array[lo:start] must already be sorted.
+
+    Each item is placed after any equal items, which keeps the sort stable.
+    """
+    for i in range(start, hi):
+        pivot = array[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) >> 1
+            if pivot < array[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        if left != i:
+            array[left + 1: i + 1] = array[left: i]
+            array[left] = pivot
+
+
+def gallop_left(key: AnyType, array: list[AnyType], base: int, n: int, hint: int) -> int:
+    """Return k in 0..n such that array[base + k - 1] < key <= array[base + k].
+
+    array[base:base + n] must be sorted, the search starts at base + hint and
+    gallops outwards, which is fast when the position is close to the hint.
+    """
+    last_ofs, ofs = 0, 1
+    if array[base + hint] < key:
+        # gallop right until array[base + hint + last_ofs] < key <= array[base + hint + ofs]
+        max_ofs = n - hint
+        while ofs < max_ofs and array[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+    else:
+        # gallop left until array[base + hint - ofs] < key <= array[base + hint - last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and not array[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    # binary search with array[base + last_ofs] < key <= array[base + ofs]
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if array[base + mid] < key:
+            last_ofs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def gallop_right(key: AnyType, array: list[AnyType], base: int, n: int, hint: int) -> int:
+    """Return k in 0..n such that array[base + k - 1] <= key < array[base + k].
+
+    Like gallop_left, except that it returns the position after any items equal to key.
+    """
+    last_ofs, ofs = 0, 1
+    if key < array[base + hint]:
+        # gallop left until array[base + hint - ofs] <= key < array[base + hint - last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < array[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        # gallop right until array[base + hint + last_ofs] <= key < array[base + hint + ofs]
+        max_ofs = n - hint
+        while ofs < max_ofs and not key < array[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+
+    # binary search with array[base + last_ofs] <= key < array[base + ofs]
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < array[base + mid]:
+            ofs = mid
+        else:
+            last_ofs = mid + 1
+    return ofs
+
+
+class MergeState:
+    "Hold the array being sorted and the stack of pending runs to be merged."
+
+    def __init__(self, array: list[AnyType], /) -> None:
+        self.array = array
+        self.min_gallop = MIN_GALLOP
+        # (base, length) of the runs that aren't merged yet
+        self.runs: list[tuple[int, int]] = []
+
+    def merge_collapse(self, /) -> None:
+        """Merge runs until the invariants below hold for the top of the stack.
+
+        1. runs[-3].length > runs[-2].length + runs[-1].length
+        2. runs[-2].length > runs[-1].length
+
+        The invariants are rechecked one level deeper as well, so that they
+        hold for the whole stack and its depth stays logarithmic.
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break  # invariants established
+            self.merge_at(n)
+
+    def merge_force_collapse(self, /) -> None:
+        "Merge all the runs on the stack until only one remains."
+
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i: int, /) -> None:
+        "Merge the two adjacent runs at runs[i] and runs[i + 1]."
+
+        array, runs = self.array, self.runs
+        base_a, na = runs[i]
+        base_b, nb = runs[i + 1]
+        runs[i] = (base_a, na + nb)
+        del runs[i + 1]
+
+        # items of A smaller than B[0] are already in place
+        k = gallop_right(array[base_b], array, base_a, na, 0)
+        base_a += k
+        na -= k
+        if na == 0:
+            return
+
+        # items of B bigger than A[-1] are already in place
+        nb = gallop_left(array[base_a + na - 1], array, base_b, nb, nb - 1)
+        if nb == 0:
+            return
+
+        if na <= nb:
+            self.merge_lo(base_a, na, base_b, nb)
+        else:
+            self.merge_hi(base_a, na, base_b, nb)
+
+    def merge_lo(self, base_a: int, na: int, base_b: int, nb: int, /) -> None:
+        """Merge the runs A and B in place from the left, copying A aside.
+
+        Requires na <= nb, B[0] < A[0] and A[-1] bigger than any item of B.
+        """
+        array = self.array
+        temp = array[base_a: base_a + na]
+        i, j, dest = 0, base_b, base_a
+        min_gallop = self.min_gallop
+
+        array[dest] = array[j]
+        dest += 1
+        j += 1
+        nb -= 1
+
+        while na > 1 and nb > 0:
+            acount = bcount = 0  # number of times A or B won in a row
+
+            # one pair at a time until one run starts winning consistently
+            while True:
+                if array[j] < temp[i]:
+                    array[dest] = array[j]
+                    dest += 1
+                    j += 1
+                    nb -= 1
+                    bcount += 1
+                    acount = 0
+                    if nb == 0 or bcount >= min_gallop:
+                        break
+                else:
+                    array[dest] = temp[i]
+                    dest += 1
+                    i += 1
+                    na -= 1
+                    acount += 1
+                    bcount = 0
+                    if na == 1 or acount >= min_gallop:
+                        break
+
+            # gallop until neither run is winning consistently anymore
+            min_gallop += 1
+            while na > 1 and nb > 0:
+                min_gallop -= min_gallop > 1
+
+                k = acount = gallop_right(array[j], temp, i, na, 0)
+                if k:
+                    array[dest: dest + k] = temp[i: i + k]
+                    dest += k
+                    i += k
+                    na -= k
+                    if na <= 1:
+                        break
+                array[dest] = array[j]
+                dest += 1
+                j += 1
+                nb -= 1
+                if nb == 0:
+                    break
+
+                k = bcount = gallop_left(temp[i], array, j, nb, 0)
+                if k:
+                    array[dest: dest + k] = array[j: j + k]
+                    dest += k
+                    j += k
+                    nb -= k
+                    if nb == 0:
+                        break
+                array[dest] = temp[i]
+                dest += 1
+                i += 1
+                na -= 1
+
+                if acount < MIN_GALLOP and bcount < MIN_GALLOP:
+                    min_gallop += 1  # penalize leaving galloping mode
+                    break
+
+        self.min_gallop = max(min_gallop, 1)
+        # what is left of B comes first, then what is left of A
+        array[dest: dest + nb] = array[j: j + nb]
+        array[dest + nb: dest + nb + na] = temp[i: i + na]
+
+    def merge_hi(self, base_a: int, na: int, base_b: int, nb: int, /) -> None:
+        """Merge the runs A and B in place from the right, copying B aside.
+
+        Requires na >= nb, B[0] < A[0] and A[-1] bigger than any item of B.
+        """
+        array = self.array
+        temp = array[base_b: base_b + nb]
+        i, j, dest = base_a + na - 1, nb - 1, base_b + nb - 1
+        min_gallop = self.min_gallop
+
+        array[dest] = array[i]
+        dest -= 1
+        i -= 1
+        na -= 1
+
+        while nb > 1 and na > 0:
+            acount = bcount = 0  # number of times A or B won in a row
+
+            # one pair at a time until one run starts winning consistently
+            while True:
+                if temp[j] < array[i]:
+                    array[dest] = array[i]
+                    dest -= 1
+                    i -= 1
+                    na -= 1
+                    acount += 1
+                    bcount = 0
+                    if na == 0 or acount >= min_gallop:
+                        break
+                else:
+                    array[dest] = temp[j]
+                    dest -= 1
+                    j -= 1
+                    nb -= 1
+                    bcount += 1
+                    acount = 0
+                    if nb == 1 or bcount >= min_gallop:
+                        break
+
+            # gallop until neither run is winning consistently anymore
+            min_gallop += 1
+            while nb > 1 and na > 0:
+                min_gallop -= min_gallop > 1
+
+                k = acount = na - gallop_right(temp[j], array, base_a, na, na - 1)
+                if k:
+                    dest -= k
+                    i -= k
+                    array[dest + 1: dest + k + 1] = array[i + 1: i + k + 1]
+                    na -= k
+                    if na == 0:
+                        break
+                array[dest] = temp[j]
+                dest -= 1
+                j -= 1
+                nb -= 1
+                if nb == 1:
+                    break
+
+                k = bcount = nb - gallop_left(array[i], temp, 0, nb, nb - 1)
+                if k:
+                    dest -= k
+                    j -= k
+                    array[dest + 1: dest + k + 1] = temp[j + 1: j + k + 1]
+                    nb -= k
+                    if nb <= 1:
+                        break
+                array[dest] = array[i]
+                dest -= 1
+                i -= 1
+                na -= 1
+                if na == 0:
+                    break
+
+                if acount < MIN_GALLOP and bcount < MIN_GALLOP:
+                    min_gallop += 1  # penalize leaving galloping mode
+                    break
+
+        self.min_gallop = max(min_gallop, 1)
+        # what is left of A moves to the end, what is left of B comes first
+        array[dest - na + 1: dest + 1] = array[base_a: base_a + na]
+        array[base_a: base_a + nb] = temp[:nb]
+
 
-# * Returns a single sorted array from two sorted array
-def merge(left: list[AnyType], right: list[AnyType]) -> list[AnyType]:
-    if not left:
-        return right
-    if not right:
-        return left
-    if left[0] < right[0]:
-        return [left[0]] + merge(left[1:], right)
-    return [right[0]] + merge(left, right[1:])
-
-# * Note: This is pythonic implementation of timsort algorithm
 def timsort(array: list[AnyType]) -> list[AnyType]:
+    """Sort array in place and return it.
+
+    The sort is stable and only uses the < operator to compare items,
+    the run stack keeps the memory used for merging bounded without recursion.
+    """
     length = len(array)
-    if length > 1000:
-        from sys import setrecursionlimit
-        setrecursionlimit(length)
-
-    runs: list[AnyType] = []
-    sorted_runs: list[AnyType] = []
-
-    new_run = [array[0]]
-    for i in range(1, length):
-        # if i is at the last index
-        if i == length - 1:
-            new_run.append(array[i])
-            runs.append(new_run)
-            break
-        if array[i] < array[i - 1]:
-            # if new_run is None (empty)
-            if not new_run:
-                runs.append([array[i]])
-                new_run.append(array[i])
-            else:
-                runs.append(new_run)
-                new_run = [array[i]]
+    if length < 2:
+        return array
+
+    state = MergeState(array)
+    minrun = compute_minrun(length)
+    lo = 0
+    while lo < length:
+        run_len = count_run(array, lo, length)
+        # extend short runs to minrun with binary insertion
+        if run_len < minrun:
+            force = min(minrun, length - lo)
+            binary_insertion_sort(array, lo, lo + force, lo + run_len)
+            run_len = force
+        state.runs.append((lo, run_len))
+        state.merge_collapse()
+        lo += run_len
+    state.merge_force_collapse()
+    return array
+
+
+# Items are written to and read back from the spill files in batches of this size.
+SPILL_BATCH_SIZE = 1024
+
+
+def read_run(file: AnyType) -> Iterator[AnyType]:
+    "Yield the items of a sorted run spilled to file, one batch in memory at a time."
+
+    file.seek(0)
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
+
+
+def spill_run(run: list[AnyType], key: Callable[[AnyType], AnyType] | None, reverse: bool) -> AnyType:
+    "Sort run and write it to a new temporary file, which is returned."
+
+    run = Sorted(run, key=key, reverse=reverse)
+    file = TemporaryFile()
+    try:
+        for i in range(0, len(run), SPILL_BATCH_SIZE):
+            pickle.dump(run[i: i + SPILL_BATCH_SIZE], file, pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        file.close()
+        raise
+    return file
+
+
+def merge_runs(files: list[AnyType], decorated: bool, reverse: bool) -> Iterator[AnyType]:
+    """Yield the k-way merge of the sorted runs in files, closing them when done.
+
+    If decorated, the runs hold (key, item) pairs and only the items are yielded.
+    """
+    try:
+        if not decorated:
+            yield from heapq.merge(*map(read_run, files), reverse=reverse)
         else:
-            new_run.append(array[i])
-    # for every item in runs, append it using insertion sort
-    for item in runs:
-        sorted_runs.append(insertion_sort(item))
-    # for every run in sorted_runs, merge them
-    sorted_array = []
-    for run in sorted_runs:
-        sorted_array = merge(sorted_array, run)
-    return sorted_array
-
-
-def Sorted(iterable: Iterable[T], /, *, key: Callable[[T], T] | None = None, reverse: bool = False) -> list[T]:
+            merged = heapq.merge(*map(read_run, files), key=itemgetter(0), reverse=reverse)
+            yield from map(itemgetter(1), merged)
+    finally:
+        for file in files:
+            file.close()
+
+
+def external_sort(iterable: Iterable[T], key: Callable[[T], AnyType] | None,
+                  reverse: bool, max_memory: int) -> Iterator[T]:
+    """Return an iterator over the items of iterable in sorted order,
+    keeping about max_memory bytes of items in memory at a time.
+
+    Items are collected into runs until their size, as estimated with
+    sys.getsizeof, reaches max_memory. Each run is sorted and pickled to
+    a temporary file, the runs are then merged back lazily. Temporary
+    files are deleted once the result is exhausted, closed or on error.
+    """
+    # items are paired with their key, so that key is called once per item
+    get_key = None if key is None else itemgetter(0)
+
+    files: list[AnyType] = []
+    run: list[AnyType] = []
+    size = 0
+    try:
+        for item in iterable:
+            if key is None:
+                run.append(item)
+                size += getsizeof(item)
+            else:
+                item_key = key(item)
+                run.append((item_key, item))
+                size += getsizeof(item) + getsizeof(item_key)
+            if size >= max_memory:
+                files.append(spill_run(run, get_key, reverse))
+                run, size = [], 0
+
+        # everything fitted in memory, no need to merge
+        if not files:
+            run = Sorted(run, key=get_key, reverse=reverse)
+            return iter(run) if key is None else map(itemgetter(1), run)
+
+        if run:
+            files.append(spill_run(run, get_key, reverse))
+            run.clear()
+    except BaseException:
+        for file in files:
+            file.close()
+        raise
+
+    return merge_runs(files, key is not None, reverse)
+
+
+def Sorted(iterable: Iterable[T], /, *, key: Callable[[T], AnyType] | None = None, reverse: bool = False) -> list[T]:
     """Return a new list containing all items from the iterable in ascending order.
 
     A custom key function can be supplied to customize the sort order, and the
@@ -360,23 +1292,105 @@ def Sorted(iterable: Iterable[T], /, *, key: Callable[[T], T] | None = None, rev
     array = iterable.copy() if isinstance(
         iterable, list) else list(iterable)
 
+    # reversing before and after sorting keeps equal items in their original order
+    if reverse:
+        array.reverse()
+
     if key is None:
-        sorted_array = timsort(array)
+        timsort(array)
     else:
-        if reverse:
-            array.reverse()
-        # sorting array elements using key
-        key_sorted = timsort([key(k) for k in array])
-        # sorting array using sorted key elements
-        sorted_array: list[AnyType] = []
-        for k_item in key_sorted:
-            for item in array:
-                if k_item == key(item):
-                    sorted_array.append(item)
-                    array.remove(item)
+        # decorate every item with its key, computed exactly once, and its
+        # position so that items with equal keys are never compared
+        decorated = [(key(item), idx) for idx, item in enumerate(array)]
+        timsort(decorated)
+        array = [array[idx] for _, idx in decorated]
+
     if reverse:
-        sorted_array.reverse()
-    return sorted_array
+        array.reverse()
+    return array
+
+
+__all__.append("ExternalSorted")
+
+# * Note: `ExternalSorted` isn't a python built-in function, it's
+# Sorted out of core for inputs that don't fit in memory.
+def ExternalSorted(iterable: Iterable[T], /, *, key: Callable[[T], AnyType] | None = None, reverse: bool = False,
+                   max_memory: int) -> Iterator[T]:
+    """Return an iterator over all items from the iterable in ascending order.
+
+    Items are sorted in runs of about max_memory bytes which are spilled to
+    temporary files, and the returned iterator streams the merge of those
+    runs. The order is identical to Sorted(iterable, key=key, reverse=reverse).
+    """
+    check_type("'%s' object cannot be interpreted as an integer", [max_memory, int])
+    if max_memory < 1:
+        raise ValueError("max_memory must be greater than 0")
+
+    return external_sort(iterable, key, reverse, max_memory)
+
+
+__all__.append("ParallelSorted")
+
+# Inputs shorter than this are sorted serially by ParallelSorted,
+# below it starting the worker processes costs more than it saves.
+PARALLEL_THRESHOLD = 100_000
+
+
+def sort_chunk(chunk: list[AnyType]) -> list[AnyType]:
+    "Sort a chunk of items in a worker process and return it."
+
+    return timsort(chunk)
+
+
+# * Note: `ParallelSorted` isn't a python built-in function, it's
+# Sorted spread over multiple processes for very large inputs.
+def ParallelSorted(iterable: Iterable[T], /, *, key: Callable[[T], AnyType] | None = None, reverse: bool = False,
+                   workers: int | None = None, threshold: int = PARALLEL_THRESHOLD) -> list[T]:
+    """Return a new list containing all items from the iterable in ascending order.
+
+    The items are split into one chunk per worker, the chunks are sorted by a
+    pool of worker processes and then combined with a heap based k-way merge.
+    The result is identical to Sorted(iterable, key=key, reverse=reverse).
+
+    workers defaults to the number of CPUs, inputs shorter than threshold
+    are sorted serially. The items, or their keys when key is given, are
+    sent to the workers and must be picklable.
+    """
+    check_type("'%s' object cannot be interpreted as an integer", [threshold, int])
+    if workers is None:
+        workers = cpu_count() or 1
+    check_type("'%s' object cannot be interpreted as an integer", [workers, int])
+    if workers < 1:
+        raise ValueError("workers must be greater than 0")
+
+    array = iterable.copy() if isinstance(
+        iterable, list) else list(iterable)
+
+    length = len(array)
+    if workers == 1 or length < threshold:
+        return Sorted(array, key=key, reverse=reverse)
+
+    # reversing before and after sorting keeps equal items in their original order
+    if reverse:
+        array.reverse()
+
+    # keys are computed once here, so key itself needn't be picklable
+    values = array if key is None else [
+        (key(item), idx) for idx, item in enumerate(array)]
+
+    size = -(-length // workers)  # ceiling division
+    chunks = [values[i: i + size] for i in range(0, length, size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(sort_chunk, chunks))
+
+    # ties are taken from the earlier chunk first, which keeps the merge stable
+    merged = list(heapq.merge(*runs))
+    if key is not None:
+        merged = [array[idx] for _, idx in merged]
+
+    if reverse:
+        merged.reverse()
+    return merged
 
 
 class Enumerate(Generic[T]):
@@ -477,26 +1491,205 @@ class Reversed(Generic[T]):
         self.__dict__.update(state)
 
 
+__all__.append("Batched")
+
+# * Note: `Batched` isn't a python built-in function, it's itertools.batched,
+# the chunked iteration behind the batch modes of Map and Reduce.
+class Batched(Generic[T]):
+    """Batched(iterable, n) --> Batched object
+
+    Batch data into tuples of length n. The last batch may be shorter.
+    """
+
+    def __init__(self, iterable: Iterable[T], n: int, /) -> None:
+        check_type("'%s' object cannot be interpreted as an integer", [n, int])
+        if n < 1:
+            raise ValueError("n must be at least one")
+
+        self.__iter = iter(iterable)
+        self.__size = n
+
+    def __iter__(self, /) -> Self:
+        return self
+
+    def __next__(self, /) -> tuple[T, ...]:
+        batch = tuple(islice(self.__iter, self.__size))
+        if not batch:
+            raise StopIteration
+        return batch
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+    def __getstate__(self, /) -> dict[str, AnyType]:
+        "Return state information for pickling."
+
+        # Copy the object's state from self.__dict__ which contains
+        # all our instance attributes. Always use the dict.copy()
+        # method to avoid modifying the original state.
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: dict[str, AnyType], /) -> None:
+        "Set state information for unpickling."
+
+        # Restore instance attributes (i.e., filename and lineno).
+        self.__dict__.update(state)
+
+
+def zip_batches(iterables: Iterable[Iterable[T]], n: int) -> Iterator[tuple[tuple[T, ...], ...]]:
+    "Yield tuples of aligned batches of up to n items, one from each of the iterables."
+
+    iters = [iter(i) for i in iterables]
+    while True:
+        batches = tuple(tuple(islice(i, n)) for i in iters)
+        size = min(map(len, batches))
+        if size < n:
+            # the shortest iterable is exhausted, trim the others to it
+            if size:
+                yield tuple(batch[:size] for batch in batches)
+            return
+        yield batches
+
+
+def call_batch(func: Callable[..., Iterable[R]], batches: tuple[tuple[AnyType, ...], ...]) -> list[R]:
+    "Call func with whole batches as its arguments and return the results as a list."
+
+    # a list also lets the results come back from worker processes
+    return list(func(*batches))
+
+
 class Map(Generic[R, T]):
     """make an iterator that computes the function using arguments from
 
     each of the iterables. stops when the shortest iterable is exhausted.
+
+    If executor is "thread" or "process", or an Executor instance, the calls
+    run concurrently in a pool of workers (default: the number of CPUs).
+    At most prefetch calls (default: twice the workers) are in flight at a
+    time, so the iterables are still consumed lazily. Results come in input
+    order unless ordered is false, in which case they come as they complete.
+    An exception raised by a call is raised when its result is reached.
+
+    If batch is given, func is called once per batch of up to that many items,
+    with a tuple of items from each of the iterables, and must return an
+    iterable of their results (e.g. a NumPy ufunc), which are yielded one by
+    one. With an executor each batch is one call, unordered results then come
+    batch by batch.
     """
 
-    def __init__(self, /, func: Callable[[T], R] | Callable[..., R], *args: Iterable[T]) -> None:
+    def __init__(self, /, func: Callable[[T], R] | Callable[..., R], *args: Iterable[T],
+                 executor: str | Executor | None = None, workers: int | None = None,
+                 ordered: bool = True, prefetch: int | None = None, batch: int | None = None) -> None:
         if not args:
             raise TypeError(
                 f"{self.__class__.__name__}() must have at least two arguments.")
 
         self.__func = func
         self.__iters = [iter(i) for i in args]
+        self.__executor: Executor | None = None
+        self.__batches: Map[list[R], AnyType] | None = None
+
+        if batch is not None:
+            check_type("'%s' object cannot be interpreted as an integer", [batch, int])
+            if batch < 1:
+                raise ValueError("batch must be greater than 0")
+
+            # an inner Map calls func per batch, this one flattens the results
+            self.__batches = Map(partial(call_batch, func), zip_batches(args, batch),
+                                 executor=executor, workers=workers, ordered=ordered, prefetch=prefetch)
+            self.__results = chain.from_iterable(self.__batches)
+            return
+
+        if executor is None:
+            return
+
+        if workers is None:
+            workers = cpu_count() or 1
+        if prefetch is None:
+            prefetch = 2 * workers
+        check_type("'%s' object cannot be interpreted as an integer",
+                   [workers, int], [prefetch, int])
+        if workers < 1 or prefetch < 1:
+            raise ValueError("workers and prefetch must be greater than 0")
+
+        # executors created here are shut down once exhausted or closed
+        self.__owns_executor = not isinstance(executor, Executor)
+        if executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=workers)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(max_workers=workers)
+        elif not isinstance(executor, Executor):
+            raise ValueError(
+                f"executor must be 'thread', 'process' or an Executor, not {executor!r}")
+
+        self.__executor = executor
+        self.__ordered = ordered
+        self.__prefetch = prefetch
+        self.__exhausted = False
+        self.__pending: deque[Future[R]] | set[Future[R]] = deque() if ordered else set()
 
     def __iter__(self, /) -> Self:
         return self
 
     def __next__(self, /) -> R:
-        args = [next(i) for i in self.__iters]
-        return self.__func(*args)
+        if self.__executor is None:
+            if self.__batches is not None:
+                return next(self.__results)
+            args = [next(i) for i in self.__iters]
+            return self.__func(*args)
+
+        self.__submit()
+        pending = self.__pending
+        if not pending:
+            self.close()
+            raise StopIteration
+
+        if self.__ordered:
+            future = pending.popleft()  # type: ignore
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            pending.remove(future)  # type: ignore
+
+        try:
+            return future.result()
+        except BaseException:
+            self.close()
+            raise
+
+    def __submit(self, /) -> None:
+        "Submit calls until prefetch of them are in flight or the iterables are exhausted."
+
+        pending = self.__pending
+        add = pending.append if self.__ordered else pending.add  # type: ignore
+        while not self.__exhausted and len(pending) < self.__prefetch:
+            try:
+                args = [next(i) for i in self.__iters]
+            except StopIteration:
+                self.__exhausted = True
+                break
+            add(self.__executor.submit(self.__func, *args))  # type: ignore
+
+    def close(self, /) -> None:
+        """Cancel the calls in flight and stop iterating.
+
+        Executors created by Map are shut down, ones passed in are left running.
+        """
+        if self.__batches is not None:
+            self.__batches.close()
+            return
+        if self.__executor is None:
+            return
+
+        self.__exhausted = True
+        for future in self.__pending:
+            future.cancel()
+        self.__pending.clear()
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
 
     def __repr__(self, /) -> str:
         return "<%s object at %s>" % (
@@ -536,18 +1729,39 @@ class Zip(Generic[T]):
 
     def __init__(self, /, *args: Iterable[T], strict: bool = False) -> None:
         self.__strict = strict
-        self.__pargs = args
         self.__iters = [iter(i) for i in args]
 
     def __iter__(self, /) -> Self:
-        self.__check_eq()
         return self
 
     def __next__(self, /) -> tuple[T, ...]:
-        if not self.__iters:
-            raise StopIteration
-
-        return tuple(next(item) for item in self.__iters)
+        iters = self.__iters
+        size = len(iters)
+        pos = 0
+        try:
+            # two and three iterables are taken without building a list first
+            if size == 2:
+                first = next(iters[0])
+                pos = 1
+                return (first, next(iters[1]))
+            if size == 3:
+                first = next(iters[0])
+                pos = 1
+                second = next(iters[1])
+                pos = 2
+                return (first, second, next(iters[2]))
+            if not size:
+                raise StopIteration
+
+            items: list[T] = []
+            for pos, it in enumerate(iters):
+                items.append(next(it))
+            return tuple(items)
+        except StopIteration:
+            self.__iters = []
+            if self.__strict and size:
+                self.__check_exhausted(iters, pos)
+            raise
 
     def __repr__(self, /) -> str:
         return "<%s object at %s>" % (
@@ -569,18 +1783,27 @@ class Zip(Generic[T]):
         # Restore instance attributes (i.e., filename and lineno).
         self.__dict__.update(state)
 
-    def __check_eq(self, /) -> None:
-        self.__pargs: AnyType
-        if self.__strict and self.__pargs:
-            initial = len(self.__pargs[0])
-            name = self.__class__.__name__
-            for pos, value in enumerate(map(len, self.__pargs), start=1):
-                if value > initial:
-                    raise ValueError(
-                        f"{name}() argument {pos} is longer than argument 1{1-pos if pos != 2 else ''}")
-                if value < initial:
-                    raise ValueError(
-                        f"{name}() argument {pos} is shorter than arguments 1{1-pos if pos != 2 else ''}")
+    def __check_exhausted(self, iters: list[Iterator[T]], pos: int, /) -> None:
+        """Raise ValueError unless all iterators are exhausted along with iters[pos].
+
+        Like CPython, lengths are only compared once an iterator runs out,
+        so strict works on any iterator, even unbounded ones.
+        """
+        name = self.__class__.__name__
+        if pos:
+            raise strict_zip_error(name, pos, longer=False)
+
+        for pos, it in enumerate(iters[1:], start=1):
+            if next(it, MISSING) is not MISSING:
+                raise strict_zip_error(name, pos, longer=True)
+
+
+def strict_zip_error(name: str, pos: int, /, *, longer: bool) -> ValueError:
+    "Return the error of a strict zip whose argument pos + 1 is longer or shorter than the previous ones."
+
+    plural = " 1" if pos == 1 else f"s 1-{pos}"
+    return ValueError(
+        f"{name}() argument {pos + 1} is {'longer' if longer else 'shorter'} than argument{plural}")
 
 
 class Filter(Generic[T]):
@@ -591,17 +1814,25 @@ class Filter(Generic[T]):
     """
 
     def __init__(self, /, function: Callable[[T], AnyType] | None, iterable: Iterable[T]):
-        if function is None:
-            def function(x: T) -> T:
-                return x
-
-        self.__iters = iter([i for i in iterable if function(i)])
+        # items are tested one at a time in __next__, only the source
+        # iterator is kept, which also keeps the object picklable
+        self.__func = function
+        self.__iters = iter(iterable)
 
     def __iter__(self, /) -> Self:
         return self
 
     def __next__(self, /) -> T:
-        return next(self.__iters)
+        function = self.__func
+        if function is None:
+            for item in self.__iters:
+                if item:
+                    return item
+        else:
+            for item in self.__iters:
+                if function(item):
+                    return item
+        raise StopIteration
 
     def __repr__(self, /) -> str:
         return "<%s object at %s>" % (
@@ -624,11 +1855,203 @@ class Filter(Generic[T]):
         self.__dict__.update(state)
 
 
+__all__.append("Pipeline")
+
+# * Note: `Pipeline` isn't a python built-in, it fuses chains of
+# Map, Filter, Enumerate and Zip into a single loop.
+
+# Kinds of stages a Pipeline can hold.
+MAP_STAGE = 0
+FILTER_STAGE = 1
+ENUMERATE_STAGE = 2
+ZIP_STAGE = 3
+
+
+def run_stages(source: Iterable[AnyType], stages: tuple[tuple[int, AnyType], ...]) -> Iterator[AnyType]:
+    """Yield the items of source passed through all the stages in a single loop.
+
+    An item goes through the whole chain inside this one generator, without
+    any per-stage __next__ call or intermediate iterator.
+    """
+    # the zip stages need their iterators and the enumerate stages a running count
+    steps: list[tuple[int, AnyType]] = []
+    for kind, arg in stages:
+        if kind == ZIP_STAGE:
+            steps.append((kind, [iter(i) for i in arg]))
+        elif kind == ENUMERATE_STAGE:
+            steps.append((kind, [arg]))
+        else:
+            steps.append((kind, arg))
+
+    for item in source:
+        for kind, arg in steps:
+            if kind == MAP_STAGE:
+                item = arg(item)
+            elif kind == FILTER_STAGE:
+                if not (item if arg is None else arg(item)):
+                    break
+            elif kind == ENUMERATE_STAGE:
+                item = (arg[0], item)
+                arg[0] += 1
+            else:
+                try:
+                    item = (item, *[next(it) for it in arg])
+                except StopIteration:
+                    return
+        else:
+            yield item
+
+
+class Pipeline(Generic[T]):
+    """Pipeline(iterable) --> Pipeline object
+
+    Chain map, filter, enumerate and zip stages over an iterable, e.g.
+
+      >>> list(Pipeline(range(6)).map(abs).filter(lambda x: x % 2).enumerate())
+      [(0, 1), (1, 3), (2, 5)]
+
+    Each method returns a new Pipeline with the stage appended, nothing
+    runs until the pipeline is iterated. All the stages are then fused
+    into a single loop, so the per item overhead doesn't grow with the
+    number of stages the way it does when chaining Map, Filter,
+    Enumerate and Zip objects. Items can also be consumed in batches.
+    """
+
+    def __init__(self, iterable: Iterable[T], /) -> None:
+        self.__source = iterable
+        self.__stages: tuple[tuple[int, AnyType], ...] = ()
+        self.__iter: Iterator[T] | None = None
+
+    def __add_stage(self, kind: int, arg: AnyType, /) -> "Pipeline[AnyType]":
+        if self.__iter is not None:
+            raise ValueError(
+                f"can't add stages to a {self.__class__.__name__} already iterated")
+
+        new = self.__class__(self.__source)
+        new.__stages = self.__stages + ((kind, arg),)
+        return new
+
+    def map(self, function: Callable[[T], R], /) -> "Pipeline[R]":
+        "Append a stage computing function(item) for every item, like Map."
+
+        if not callable(function):
+            raise TypeError(
+                f"{type(function).__name__!r} object is not callable")
+
+        return self.__add_stage(MAP_STAGE, function)
+
+    def filter(self, function: Callable[[T], AnyType] | None = None, /) -> "Pipeline[T]":
+        "Append a stage keeping the items for which function(item) is true, like Filter."
+
+        if function is not None and not callable(function):
+            raise TypeError(
+                f"{type(function).__name__!r} object is not callable")
+
+        return self.__add_stage(FILTER_STAGE, function)
+
+    def enumerate(self, start: int = 0) -> "Pipeline[tuple[int, T]]":
+        "Append a stage pairing every item with a count from start, like Enumerate."
+
+        if not isinstance(start, int):  # type: ignore
+            raise TypeError(
+                f"{type(start).__name__!r} object cannot be interpreted as an integer")
+
+        return self.__add_stage(ENUMERATE_STAGE, start)
+
+    def zip(self, *iterables: Iterable[AnyType]) -> "Pipeline[tuple[AnyType, ...]]":
+        """Append a stage pairing every item with the next items of iterables, like Zip.
+
+        The pipeline stops when the shortest of them is exhausted.
+        """
+        return self.__add_stage(ZIP_STAGE, iterables)
+
+    def __iter__(self, /) -> Self:
+        return self
+
+    def __next__(self, /) -> T:
+        if self.__iter is None:
+            self.__iter = run_stages(self.__source, self.__stages)
+        return next(self.__iter)
+
+    def batches(self, size: int, /) -> Iterator[list[T]]:
+        "Yield the remaining items in lists of size items, the last one may be shorter."
+
+        check_type("'%s' object cannot be interpreted as an integer", [size, int])
+        if size < 1:
+            raise ValueError("size must be at least one")
+
+        while True:
+            batch = list(islice(self, size))
+            if not batch:
+                return
+            yield batch
+
+    def __repr__(self, /) -> str:
+        return "<%s object at %s>" % (
+            self.__class__.__name__,
+            str(hex(id(self))).replace('x', 'x00000').upper()
+        )
+
+
 __all__.append("Reduce")
 
+# A parallel Reduce sends the items to the worker processes in chunks of
+# this size, inputs no longer than one chunk are reduced serially.
+REDUCE_CHUNKSIZE = 8192
+
+
+def reduce_chunk(function: Callable[[AnyType, AnyType], AnyType], chunk: Iterable[AnyType]) -> AnyType:
+    "Fold a non-empty chunk from left to right."
+
+    it = iter(chunk)
+    value = next(it)
+    for element in it:
+        value = function(value, element)
+    return value
+
+
+def reduce_tree(function: Callable[[AnyType, AnyType], AnyType], values: list[AnyType]) -> AnyType:
+    "Combine non-empty values pairwise in a balanced tree, keeping their order."
+
+    while len(values) > 1:
+        pairs = [function(values[i], values[i + 1])
+                 for i in range(0, len(values) - 1, 2)]
+        if len(values) & 1:
+            pairs.append(values[-1])
+        values = pairs
+    return values[0]
+
+
+def parallel_reduce(function: Callable[[AnyType, AnyType], AnyType], it: Iterator[AnyType],
+                    workers: int, commutative: bool) -> AnyType:
+    "Reduce the chunks of it in worker processes, return MISSING if it's empty."
+
+    first = tuple(islice(it, REDUCE_CHUNKSIZE))
+    if not first:
+        return MISSING
+    if workers == 1 or len(first) < REDUCE_CHUNKSIZE:
+        return reduce_chunk(function, chain(first, it))
+
+    chunks = chain([first], Batched(it, REDUCE_CHUNKSIZE))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = Map(partial(reduce_chunk, function), chunks,
+                       executor=executor, workers=workers, ordered=not commutative)
+        if not commutative:
+            return reduce_tree(function, list(partials))
+
+        # any order will do, so each partial result is folded in once it's ready
+        value = next(partials)
+        for element in partials:
+            value = function(value, element)
+        return value
+
+
 # * Note: `reduce` is functools library function not a python built-in function.
-def Reduce(function: Callable[[AnyType, AnyType], T], sequence: Iterable[AnyType], initial: object = MISSING) -> T:
-    """Reduce(function, iterable[, initial]) -> value
+def Reduce(function: Callable[[AnyType, AnyType], T], sequence: Iterable[AnyType], initial: object = MISSING,
+           *, batch: int | None = None, parallel: bool = False, workers: int | None = None,
+           commutative: bool = False) -> T:
+    """Reduce(function, iterable[, initial], *, batch=None, parallel=False, workers=None,
+           commutative=False) -> value
 
     Apply a function of two arguments cumulatively to the items of a sequence
     or iterable, from left to right, so as to reduce the iterable to a single
@@ -636,7 +2059,34 @@ def Reduce(function: Callable[[AnyType, AnyType], T], sequence: Iterable[AnyType
     ((((1+2)+3)+4)+5).  If initial is present, it is placed before the items
     of the iterable in the calculation, and serves as a default when the
     iterable is empty.
+
+    If batch is given, the items after the first value are passed to function
+    a tuple of up to batch items at a time instead of one by one, e.g.
+    Reduce(lambda total, items: total + Sum(items), iterable, 0, batch=1024).
+
+    If parallel is true, function must be associative (e.g. set union, max,
+    matrix product) and picklable, like the items. Chunks of the iterable are
+    reduced by a pool of worker processes (default: the number of CPUs) and
+    their results are combined in a balanced tree, in order unless commutative
+    is true, in which case they're combined as they complete.
     """
+    if parallel:
+        if batch is not None:
+            raise ValueError("Reduce() can't use batch and parallel together")
+        if workers is None:
+            workers = cpu_count() or 1
+        check_type("'%s' object cannot be interpreted as an integer", [workers, int])
+        if workers < 1:
+            raise ValueError("workers must be greater than 0")
+
+        result = parallel_reduce(function, iter(sequence), workers, commutative)
+        if result is MISSING:
+            if initial is MISSING:
+                raise TypeError(
+                    "reduce() of empty iterable with no initial value")
+            return initial  # type: ignore
+        return result if initial is MISSING else function(initial, result)
+
     it = iter(sequence)
     if initial is MISSING:
         try:
@@ -647,6 +2097,9 @@ def Reduce(function: Callable[[AnyType, AnyType], T], sequence: Iterable[AnyType
     else:
         value = initial
 
+    if batch is not None:
+        it = Batched(it, batch)
+
     for element in it:
         value: AnyType = function(value, element)
 
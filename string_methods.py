@@ -8,7 +8,9 @@ Note: This module doesn't support unicode characters.
 
 """
 
-from typing import Iterable
+from codecs import getincrementaldecoder
+from collections import deque
+from typing import IO, Iterable, Iterator
 
 from _types import verify_type
 
@@ -17,7 +19,8 @@ __all__ = ["isupper", "islower", "isalpha", "isdecimal", "isalnum", "isspace", "
            "isprintable", "startswith", "endswith", "removeprefix", "removesuffix", "upper",
            "lower", "swapcase", "title", "capitalize", "zfill", "ljust", "rjust", "center",
            "expandtabs", "partition", "rpartition", "splitlines", "find", "rfind", "index",
-           "rindex", "count", "join", "replace", "strip", "lstrip", "rstrip", "split", "rsplit"]
+           "rindex", "count", "join", "replace", "strip", "lstrip", "rstrip", "split", "rsplit",
+           "isplit", "irsplit", "isplitlines", "AhoCorasick"]
 
 """A collection of string constants.
 
@@ -46,14 +49,366 @@ punctuation = r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""
 printable = digits + ascii_letters + punctuation + ' '
 ascii_letters_pairs = dict(zip(ascii_lowercase, ascii_uppercase))
 
+# Case conversion tables, precomputed once for O(1) lookups.
+uppercase_map = ascii_letters_pairs
+lowercase_map = dict(zip(ascii_uppercase, ascii_lowercase))
+uppercase_table = str.maketrans(uppercase_map)
+lowercase_table = str.maketrans(lowercase_map)
+swapcase_table = str.maketrans(uppercase_map | lowercase_map)
 
-def getkey(dct: dict[str, str], value: str) -> str:
-    "Return key for the value."
+# Character class flags stored in ctype_table.
+CTF_LOWER = 0x01
+CTF_UPPER = 0x02
+CTF_DIGIT = 0x04
+CTF_SPACE = 0x08
+CTF_PRINT = 0x10
+CTF_ALPHA = CTF_LOWER | CTF_UPPER
+CTF_ALNUM = CTF_ALPHA | CTF_DIGIT
 
-    for key, item in dct.items():
-        if value == item:
-            return key
-    raise KeyError(f"key not found for {value}")
+
+def make_ctype_table() -> list[int]:
+    "Return a list mapping every ASCII code point to its class flags."
+
+    table = [0] * 128
+    for flag, chars in ((CTF_LOWER, ascii_lowercase), (CTF_UPPER, ascii_uppercase),
+                        (CTF_DIGIT, digits), (CTF_SPACE, whitespace), (CTF_PRINT, printable)):
+        for char in chars:
+            table[ord(char)] |= flag
+    return table
+
+
+ctype_table = make_ctype_table()
+
+# Characters matching each class mask, used to test a whole string at once.
+ctype_chars = {
+    mask: frozenset(chr(code) for code, flags in enumerate(ctype_table) if flags & mask)
+    for mask in (CTF_LOWER, CTF_UPPER, CTF_DIGIT, CTF_SPACE, CTF_PRINT, CTF_ALPHA, CTF_ALNUM)
+}
+
+
+def get_ctype(char: str) -> int:
+    "Return the class flags of a single character, 0 for non-ASCII ones."
+
+    code = ord(char)
+    return ctype_table[code] if code < 128 else 0
+
+
+def check_all(text: str, mask: int) -> bool:
+    "Return True if every character of text matches the class mask."
+
+    return ctype_chars[mask].issuperset(text)
+
+
+def check_any(text: str, mask: int) -> bool:
+    "Return True if at least one character of text matches the class mask."
+
+    return not ctype_chars[mask].isdisjoint(text)
+
+
+def adjust_indices(start: int, end: int | None, length: int) -> tuple[int, int]:
+    "Return start and end clamped to the string length as in slice notation."
+
+    if end is None or end > length:
+        end = length
+    elif end < 0:
+        end += length
+        if end < 0:
+            end = 0
+    if start < 0:
+        start += length
+        if start < 0:
+            start = 0
+    return start, end
+
+
+# Modes for the shared substring search engine.
+FAST_COUNT = 0
+FAST_SEARCH = 1
+FAST_RSEARCH = 2
+
+
+def make_skip_table(sub: str) -> dict[str, int]:
+    """Return the Horspool shift table for searching forward.
+
+    Maps every character of sub except the last one to the distance
+    between its rightmost occurrence and the end of sub.
+    """
+    last = len(sub) - 1
+    return {sub[i]: last - i for i in range(last)}
+
+
+def make_rskip_table(sub: str) -> dict[str, int]:
+    """Return the Horspool shift table for searching backward.
+
+    Maps every character of sub except the first one to the distance
+    between its leftmost occurrence and the start of sub.
+    """
+    return {sub[i]: i for i in range(len(sub) - 1, 0, -1)}
+
+
+def iter_search(text: str, sub: str, start: int, end: int) -> Iterator[int]:
+    """Yield the index of every non-overlapping occurrence of sub
+    within text[start:end], lowest first, using Boyer-Moore-Horspool.
+
+    sub must not be empty and start, end must already be adjusted.
+    """
+    s_len = len(sub)
+    last = s_len - 1
+    last_char = sub[last]
+    skip = make_skip_table(sub)
+    i, limit = start, end - s_len
+    while i <= limit:
+        char = text[i + last]
+        if char == last_char:
+            j = last - 1
+            while j >= 0 and text[i + j] == sub[j]:
+                j -= 1
+            if j < 0:  # match found
+                yield i
+                i += s_len
+                continue
+        i += skip.get(char, s_len)
+
+
+def iter_rsearch(text: str, sub: str, start: int, end: int) -> Iterator[int]:
+    """Yield the index of every non-overlapping occurrence of sub
+    within text[start:end], highest first, using Boyer-Moore-Horspool.
+
+    sub must not be empty and start, end must already be adjusted.
+    """
+    s_len = len(sub)
+    first = sub[0]
+    skip = make_rskip_table(sub)
+    i = end - s_len
+    while i >= start:
+        char = text[i]
+        if char == first:
+            j = 1
+            while j < s_len and text[i + j] == sub[j]:
+                j += 1
+            if j == s_len:  # match found
+                yield i
+                i -= s_len
+                continue
+        i -= skip.get(char, s_len)
+
+
+def fastsearch(text: str, sub: str, start: int, end: int, mode: int, maxcount: int = -1) -> int:
+    """Search sub within text[start:end] using Boyer-Moore-Horspool.
+
+    FAST_SEARCH returns the lowest index, FAST_RSEARCH the highest index
+    (-1 on failure for both) and FAST_COUNT the number of non-overlapping
+    occurrences, stopping once maxcount is reached if it isn't negative.
+
+    sub must not be empty and start, end must already be adjusted.
+    """
+    if end - start < len(sub) or maxcount == 0:
+        return 0 if mode == FAST_COUNT else -1
+
+    if mode == FAST_SEARCH:
+        return next(iter_search(text, sub, start, end), -1)
+    if mode == FAST_RSEARCH:
+        return next(iter_rsearch(text, sub, start, end), -1)
+
+    occurrences = 0
+    for _ in iter_search(text, sub, start, end):
+        occurrences += 1
+        if occurrences == maxcount:
+            break
+    return occurrences
+
+
+class StringBuilder:
+    """Accumulate string chunks and concatenate them once.
+
+    Appending to a list of slices keeps building a string linear in
+    its final length, where repeated `result += char` may copy the
+    partial result over and over again.
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+
+    def append(self, chunk: str) -> None:
+        "Append chunk to the end of the string being built."
+
+        if chunk:
+            self._chunks.append(chunk)
+
+    def build(self) -> str:
+        "Return the concatenation of all chunks appended so far."
+
+        return "".join(self._chunks)
+
+
+class AhoCorasick:
+    """AhoCorasick(needles) -> compiled multi-pattern matcher
+
+    Build an Aho-Corasick automaton once from an iterable of non-empty
+    strings. It can then be passed instead of a str to startswith, endswith,
+    find, index, count and replace, which match all the needles at once in
+    time proportional to the text rather than to the number of needles.
+
+    Where several needles match, the one starting at the lowest index wins,
+    and among those starting at the same index the longest one. A match is
+    confirmed by the automaton as soon as no longer one can follow, and the
+    scan then resumes from its end, so the characters a longer needle ran on
+    past it are scanned again. That costs nothing when no needle extends a
+    match, as below, but in the worst case, such as "a" * n against the
+    needles "a" * m + "b" and "a", matching takes O(n * m) time for a
+    longest needle of length m:
+
+    >>> count("b" * 20000, AhoCorasick(["b", "a" * 2000]))
+    20000
+    """
+
+    # The state falling back from a match, where the match is confirmed.
+    DEAD_STATE = -1
+
+    def __init__(self, needles: Iterable[str], /) -> None:
+        patterns = tuple(needles)
+        for needle in patterns:
+            if not isinstance(needle, str):  # type: ignore
+                raise TypeError(
+                    f"{self.__class__.__name__}() needles must be str, not {type(needle).__name__}")
+            if not needle:
+                raise ValueError(f"{self.__class__.__name__}() needles must not be empty")
+
+        self.patterns = patterns
+        self.__goto, self.__terminal = self.__make_trie(patterns)
+        self.__rgoto, self.__rterminal = self.__make_trie(
+            needle[::-1] for needle in patterns)
+        self.__fail, self.__longest = self.__make_links()
+
+    def __repr__(self, /) -> str:
+        return f"{self.__class__.__name__}({self.patterns!r})"
+
+    def __len__(self, /) -> int:
+        return len(self.patterns)
+
+    @staticmethod
+    def __make_trie(needles: Iterable[str], /) -> tuple[list[dict[str, int]], list[int]]:
+        "Return the trie edges and the length of the needle ending at each node."
+
+        goto: list[dict[str, int]] = [{}]
+        terminal: list[int] = [0]
+        for needle in needles:
+            node = 0
+            for char in needle:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    terminal.append(0)
+                node = child
+            terminal[node] = len(needle)
+        return goto, terminal
+
+    def __make_links(self, /) -> tuple[list[int], list[int]]:
+        """Return the failure link of each node and the length of the
+        longest needle that is a suffix of the node's string.
+
+        For leftmost matching, a needle's node and every node below it fail
+        to DEAD_STATE: once a needle has matched, any match found by falling
+        back would start later, so the pending match is confirmed instead.
+        """
+        goto, terminal = self.__goto, self.__terminal
+        fail = [0] * len(goto)
+        longest = terminal[:]
+        dead = self.DEAD_STATE
+
+        # breadth first, so the failure links of shallower nodes are ready
+        queue: deque[int] = deque()
+        for child in goto[0].values():
+            if terminal[child]:
+                fail[child] = dead
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                if terminal[child]:
+                    fail[child] = dead
+                    continue
+
+                state = fail[node]
+                while state > 0 and char not in goto[state]:
+                    state = fail[state]
+                link = dead if state == dead else goto[state].get(char, 0)
+                fail[child] = link
+                if link != dead:
+                    longest[child] = longest[link]
+        return fail, longest
+
+    def match_prefix(self, text: str, start: int, end: int, /) -> bool:
+        "Return True if text[start:end] starts with any of the needles."
+
+        goto, terminal = self.__goto, self.__terminal
+        node = 0
+        for i in range(start, end):
+            node = goto[node].get(text[i])
+            if node is None:
+                return False
+            if terminal[node]:
+                return True
+        return False
+
+    def match_suffix(self, text: str, start: int, end: int, /) -> bool:
+        "Return True if text[start:end] ends with any of the needles."
+
+        goto, terminal = self.__rgoto, self.__rterminal
+        node = 0
+        for i in range(end - 1, start - 1, -1):
+            node = goto[node].get(text[i])
+            if node is None:
+                return False
+            if terminal[node]:
+                return True
+        return False
+
+    def iter_matches(self, text: str, start: int, end: int, /) -> Iterator[tuple[int, int]]:
+        """Yield the (start, end) indexes of every non-overlapping
+        match of the needles within text[start:end], lowest first.
+        """
+        goto, fail, longest = self.__goto, self.__fail, self.__longest
+        dead = self.DEAD_STATE
+
+        state = 0
+        best_start = best_end = -1
+        i = start
+        while i < end:
+            char = text[i]
+            i += 1
+            while True:
+                child = goto[state].get(char)
+                if child is not None:
+                    state = child
+                    break
+                if not state:
+                    break
+                state = fail[state]
+                if state == dead:
+                    break
+
+            if state != dead and longest[state]:
+                best_start, best_end = i - longest[state], i
+            if best_start >= 0 and (state == dead or i == end):
+                # no longer match can start at or before best_start,
+                # report it and scan on from where it ends
+                yield best_start, best_end
+                i, state = best_end, 0
+                best_start = -1
+
+    def find(self, text: str, start: int, end: int, /) -> int:
+        "Return the lowest index in text[start:end] where any needle is found, -1 on failure."
+
+        for match_start, _ in self.iter_matches(text, start, end):
+            return match_start
+        return -1
 
 
 def islower(text: str) -> bool:
@@ -64,14 +419,7 @@ def islower(text: str) -> bool:
     """
     verify_type([text, str])
 
-    is_lowercase = False
-    for char in text:
-        if char in ascii_letters:
-            if char in ascii_uppercase:
-                return False
-            if not is_lowercase:
-                is_lowercase = True
-    return is_lowercase
+    return check_any(text, CTF_LOWER) and not check_any(text, CTF_UPPER)
 
 
 def isupper(text: str) -> bool:
@@ -82,14 +430,7 @@ def isupper(text: str) -> bool:
     """
     verify_type([text, str])
 
-    is_uppercase = False
-    for char in text:
-        if char in ascii_letters:
-            if char in ascii_lowercase:
-                return False
-            if not is_uppercase:
-                is_uppercase = True
-    return is_uppercase
+    return check_any(text, CTF_UPPER) and not check_any(text, CTF_LOWER)
 
 
 def isalpha(text: str) -> bool:
@@ -103,10 +444,7 @@ def isalpha(text: str) -> bool:
     if not text:
         return False
 
-    for char in text:
-        if char not in ascii_letters:
-            return False
-    return True
+    return check_all(text, CTF_ALPHA)
 
 
 def isdecimal(text: str) -> bool:
@@ -120,10 +458,7 @@ def isdecimal(text: str) -> bool:
     if not text:
         return False
 
-    for char in text:
-        if char not in digits:
-            return False
-    return True
+    return check_all(text, CTF_DIGIT)
 
 
 def isalnum(text: str) -> bool:
@@ -137,11 +472,7 @@ def isalnum(text: str) -> bool:
     if not text:
         return False
 
-    ascii_alphanumeric = ascii_letters + digits
-    for char in text:
-        if char not in ascii_alphanumeric:
-            return False
-    return True
+    return check_all(text, CTF_ALNUM)
 
 
 def istitle(text: str) -> bool:
@@ -155,15 +486,15 @@ def istitle(text: str) -> bool:
     title_cased = False
     check_lowercase = True
     for char in text:
-        if char not in ascii_letters:
+        flags = get_ctype(char)
+        if not flags & CTF_ALPHA:
             check_lowercase = True
             continue
         if check_lowercase:
-            if char in ascii_lowercase:
+            if flags & CTF_LOWER:
                 return False
-            if not title_cased:
-                title_cased = True
-        elif char not in ascii_lowercase:
+            title_cased = True
+        elif flags & CTF_UPPER:
             return False
         check_lowercase = False
     return title_cased
@@ -180,10 +511,7 @@ def isspace(text: str) -> bool:
     if not text:
         return False
 
-    for char in text:
-        if char not in whitespace:
-            return False
-    return True
+    return check_all(text, CTF_SPACE)
 
 
 def isprintable(text: str) -> bool:
@@ -194,10 +522,7 @@ def isprintable(text: str) -> bool:
     """
     verify_type([text, str])
 
-    for char in text:
-        if char not in printable:
-            return False
-    return True
+    return check_all(text, CTF_PRINT)
 
 
 def lower(text: str) -> str:
@@ -205,16 +530,7 @@ def lower(text: str) -> str:
 
     verify_type([text, str])
 
-    result = ""
-    for char in text:
-        if char not in ascii_letters:
-            result += char
-            continue
-        if char in ascii_lowercase:
-            result += char
-        else:
-            result += getkey(ascii_letters_pairs, char)
-    return result
+    return text.translate(lowercase_table)
 
 
 def upper(text: str) -> str:
@@ -222,16 +538,7 @@ def upper(text: str) -> str:
 
     verify_type([text, str])
 
-    result = ""
-    for char in text:
-        if char not in ascii_letters:
-            result += char
-            continue
-        if char in ascii_uppercase:
-            result += char
-        else:
-            result += ascii_letters_pairs[char]
-    return result
+    return text.translate(uppercase_table)
 
 
 def swapcase(text: str) -> str:
@@ -239,16 +546,7 @@ def swapcase(text: str) -> str:
 
     verify_type([text, str])
 
-    result = ""
-    for char in text:
-        if char not in ascii_letters:
-            result += char
-            continue
-        if char in ascii_lowercase:
-            result += ascii_letters_pairs[char]
-        else:
-            result += getkey(ascii_letters_pairs, char)
-    return result
+    return text.translate(swapcase_table)
 
 
 def capitalize(text: str) -> str:
@@ -261,10 +559,7 @@ def capitalize(text: str) -> str:
     if not text:
         return text
 
-    result = upper(text[0])
-    for char in text[1:]:
-        result += lower(char)
-    return result
+    return upper(text[0]) + lower(text[1:])
 
 
 def title(text: str) -> str:
@@ -275,22 +570,19 @@ def title(text: str) -> str:
     """
     verify_type([text, str])
 
-    result = ""
+    result = StringBuilder()
     check = True
     for char in text:
         if char not in ascii_letters:
-            result += char
+            result.append(char)
             check = True
             continue
         if check:
-            if char in ascii_lowercase:
-                result += upper(char)
-            else:
-                result += char
+            result.append(uppercase_map.get(char, char))
         else:
-            result += lower(char)
+            result.append(lowercase_map.get(char, char))
         check = False
-    return result
+    return result.build()
 
 
 def ljust(text: str, width: int, fillchar: str = " ") -> str:
@@ -351,13 +643,23 @@ def expandtabs(text: str, tabsize: int = 8):
     """
     verify_type([text, str], [tabsize, int])
 
-    result = ""
-    for char in text:
+    result = StringBuilder()
+    column = run_start = 0
+    for i, char in enumerate(text):
         if char == "\t":
-            result += " " * tabsize
+            # copy the run before the tab as a single slice
+            result.append(text[run_start: i])
+            run_start = i + 1
+            if tabsize > 0:
+                n_space = tabsize - column % tabsize
+                result.append(" " * n_space)
+                column += n_space
+        elif char in "\n\r":
+            column = 0
         else:
-            result += char
-    return result
+            column += 1
+    result.append(text[run_start:])
+    return result.build()
 
 
 def partition(text: str, sep: str) -> tuple[str, str, str]:
@@ -370,15 +672,13 @@ def partition(text: str, sep: str) -> tuple[str, str, str]:
     """
     verify_type([text, str], [sep, str])
 
-    sep_len = len(sep)
-    for i in range(len(text)):
-        if sep == text[i: i + sep_len]:
-            return (
-                text[0: i],
-                text[i: i + sep_len],
-                text[i + sep_len:]
-            )
-    return (text, '', '')
+    if not sep:
+        raise ValueError("empty separator")
+
+    i = fastsearch(text, sep, 0, len(text), FAST_SEARCH)
+    if i == -1:
+        return (text, '', '')
+    return (text[0: i], sep, text[i + len(sep):])
 
 
 def rpartition(text: str, sep: str) -> tuple[str, str, str]:
@@ -391,43 +691,55 @@ def rpartition(text: str, sep: str) -> tuple[str, str, str]:
     """
     verify_type([text, str], [sep, str])
 
-    sep_len = len(sep)
-    for i in range(len(text) - 1, -1, -1):
-        if sep == text[i: i + sep_len]:
-            return (
-                text[0: i],
-                text[i: i + sep_len],
-                text[i + sep_len:]
-            )
-    return (text, '', '')
+    if not sep:
+        raise ValueError("empty separator")
 
+    i = fastsearch(text, sep, 0, len(text), FAST_RSEARCH)
+    if i == -1:
+        return ('', '', text)
+    return (text[0: i], sep, text[i + len(sep):])
 
-def splitlines(text: str, keepends: bool = False) -> list[str]:
-    """Return a list of the lines in the string, breaking at line boundaries.
-
-    Line breaks are not included in the resulting list unless keepends is given and true.
-    """
-    verify_type([text, str], [keepends, bool])
 
+def do_splitlines(text: str, keepends: bool) -> Iterator[str]:
     line_breaks = "\n\r\v\f"
 
-    res: str = ""
-    result: list[str] = []
+    i = line_start = 0
+    length = len(text)
 
-    for char in text:
+    while i < length:
+        char = text[i]
+        i += 1
         if char not in line_breaks:
-            res += char
             continue  # didn't find line break
-        if keepends:
-            result.append(res + char)
-        else:
-            result.append(res)
-        res = ""  # clear previous strings
+        line_end = i - 1
+        # "\r\n" is a single line break
+        if char == "\r" and i < length and text[i] == "\n":
+            i += 1
+        yield text[line_start: i if keepends else line_end]
+        line_start = i
 
     # if last char isn't in line breaks
-    if text and char not in line_breaks:  # type: ignore
-        result.append(res)
-    return result
+    if line_start < length:
+        yield text[line_start:]
+
+
+def isplitlines(text: str, keepends: bool = False) -> Iterator[str]:
+    """Return an iterator over the lines in the string, breaking at line boundaries.
+
+    Lines are produced lazily, one at a time, as slices of the string.
+    Line breaks are not included in the resulting lines unless keepends is given and true.
+    """
+    verify_type([text, str], [keepends, bool])
+
+    return do_splitlines(text, keepends)
+
+
+def splitlines(text: str, keepends: bool = False) -> list[str]:
+    """Return a list of the lines in the string, breaking at line boundaries.
+
+    Line breaks are not included in the resulting list unless keepends is given and true.
+    """
+    return list(isplitlines(text, keepends))
 
 
 def removeprefix(text: str, prefix: str) -> str:
@@ -468,17 +780,23 @@ def removesuffix(text: str, suffix: str) -> str:
     return text[0: j + 1]
 
 
-def startswith(text: str, prefix: str | tuple[str, ...], start: int = 0, end: int | None = None) -> bool:
+def startswith(text: str, prefix: str | tuple[str, ...] | AhoCorasick,
+               start: int = 0, end: int | None = None) -> bool:
     """Return True if text starts with the specified prefix, False otherwise.
 
     With optional start, test text beginning at that position.
     With optional end, stop comparing text at that position.
-    Prefix can also be a tuple of strings to try.
+    Prefix can also be a tuple of strings to try, or an AhoCorasick
+    matcher built once from many of them.
     """
     verify_type([text, str], [start, int])
     if end is not None:
         verify_type([end, int])
 
+    if isinstance(prefix, AhoCorasick):
+        start, end = adjust_indices(start, end, len(text))
+        return prefix.match_prefix(text, start, end)
+
     if end is None:
         end = len(text)
     text = text[start: end]
@@ -499,17 +817,23 @@ def startswith(text: str, prefix: str | tuple[str, ...], start: int = 0, end: in
     return False
 
 
-def endswith(text: str, suffix: str | tuple[str, ...], start: int = 0, end: int | None = None) -> bool:
+def endswith(text: str, suffix: str | tuple[str, ...] | AhoCorasick,
+             start: int = 0, end: int | None = None) -> bool:
     """Return True if text ends with the specified suffix, False otherwise.
 
     With optional start, test text beginning at that position.
     With optional end, stop comparing text at that position.
-    suffix can also be a tuple of strings to try.
+    suffix can also be a tuple of strings to try, or an AhoCorasick
+    matcher built once from many of them.
     """
     verify_type([text, str], [start, int])
     if end is not None:
         verify_type([end, int])
 
+    if isinstance(suffix, AhoCorasick):
+        start, end = adjust_indices(start, end, len(text))
+        return suffix.match_suffix(text, start, end)
+
     if end is None:
         end = len(text)
     text = text[start: end]
@@ -530,30 +854,32 @@ def endswith(text: str, suffix: str | tuple[str, ...], start: int = 0, end: int
     return False
 
 
-def find(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
+def find(text: str, sub: str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
     """Return the lowest index in text where substring sub is found,
     such that sub is contained within text[start:end].
 
     Optional arguments start and end are interpreted as in slice notation.
+    sub can also be an AhoCorasick matcher to find any of its needles.
 
     Return -1 on failure.
     """
-    verify_type([text, str], [sub, str], [start, int])
+    verify_type([text, str], [start, int])
     if end is not None:
         verify_type([end, int])
 
-    s_len = len(sub)
-    if end is None:
-        end = len(text)
+    start, end = adjust_indices(start, end, len(text))
+    if isinstance(sub, AhoCorasick):
+        return sub.find(text, start, end)
+
+    verify_type([sub, str])
+    if end - start < len(sub):
+        return -1
 
     # special case for empty strings
-    if s_len == 0:
-        return 0
+    if not sub:
+        return start
 
-    for i in range(start, end):
-        if sub == text[i: i + s_len]:
-            return i
-    return -1
+    return fastsearch(text, sub, start, end, FAST_SEARCH)
 
 
 def rfind(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
@@ -568,46 +894,28 @@ def rfind(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
     if end is not None:
         verify_type([end, int])
 
-    s_len = len(sub)
-    if end is None:
-        end = len(text)
+    start, end = adjust_indices(start, end, len(text))
+    if end - start < len(sub):
+        return -1
 
     # special case for empty strings
-    if s_len == 0:
-        if text == '':
-            return 0
-        else:
-            return end
+    if not sub:
+        return end
 
-    for i in range(end - 1, start - 1, -1):
-        if sub == text[i: i + s_len]:
-            return i
-    return -1
+    return fastsearch(text, sub, start, end, FAST_RSEARCH)
 
 
-def index(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
+def index(text: str, sub: str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
     """Return the lowest index in text where substring sub is found,
     such that sub is contained within text[start:end].
     Optional arguments start and end are interpreted as in slice notation.
 
     Raise ValueError when the substring is not found.
     """
-    verify_type([start, int])
-    if end is not None:
-        verify_type([end, int])
-
-    s_len = len(sub)
-    if end is None:
-        end = len(text)
-
-    # special case for empty strings
-    if s_len == 0:
-        return 0
-
-    for i in range(start, end):
-        if sub == text[i: i + s_len]:
-            return i
-    raise ValueError("substring not found")
+    result = find(text, sub, start, end)
+    if result == -1:
+        raise ValueError("substring not found")
+    return result
 
 
 def rindex(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
@@ -618,49 +926,38 @@ def rindex(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
 
     Raise ValueError when the substring is not found.
     """
-    verify_type([text, str], [sub, str], [start, int])
-    if end is not None:
-        verify_type([end, int])
-
-    len_sub = len(sub)
-    if end is None:
-        end = len(text)
-
-    # special case for empty strings
-    if len_sub == 0:
-        if text == '':
-            return 0
-        else:
-            return end
-
-    for i in range(end, start - 1, -1):
-        if sub == text[i: i + len_sub]:
-            return i
-    raise ValueError("substring not found")
+    result = rfind(text, sub, start, end)
+    if result == -1:
+        raise ValueError("substring not found")
+    return result
 
 
-def count(text: str, sub: str, start: int = 0, end: int | None = None) -> int:
+def count(text: str, sub: str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
     """Return the number of non-overlapping occurrences of substring sub in string text[start:end].
 
     Optional arguments start and end are interpreted as in slice notation.
+    sub can also be an AhoCorasick matcher to count all of its needles.
     """
-    verify_type([start, int])
+    verify_type([text, str], [start, int])
     if end is not None:
         verify_type([end, int])
 
-    s_len = len(sub)
-    # special case for empty strings
-    if s_len == 0:
-        return len(text) + 1
+    start, end = adjust_indices(start, end, len(text))
+    if isinstance(sub, AhoCorasick):
+        occurrences = 0
+        for _ in sub.iter_matches(text, start, end):
+            occurrences += 1
+        return occurrences
 
-    if end is None:
-        end = len(text)
+    verify_type([sub, str])
+    if end - start < len(sub):
+        return 0
 
-    occurrences = 0
-    for i in range(start, end):
-        if sub == text[i: i + s_len]:
-            occurrences += 1
-    return occurrences
+    # special case for empty strings
+    if not sub:
+        return end - start + 1
+
+    return fastsearch(text, sub, start, end, FAST_COUNT)
 
 
 def join(text: str, iterable: Iterable[str]) -> str:
@@ -688,7 +985,7 @@ def join(text: str, iterable: Iterable[str]) -> str:
     return result
 
 
-def replace(text: str, old: str, new: str, count: int = -1) -> str:
+def replace(text: str, old: str | AhoCorasick, new: str, count: int = -1) -> str:
     """Return a copy with all occurrences of substring old replaced by new.
 
     count
@@ -697,28 +994,54 @@ def replace(text: str, old: str, new: str, count: int = -1) -> str:
 
     If the optional argument count is 
     given, only the first count occurrences are replaced.
+    old can also be an AhoCorasick matcher to replace all of its needles.
     """
     # Checks for valid arguments and raise error if not valid
-    verify_type([text, str], [old, str], [new, str], [count, int])
+    verify_type([text, str], [new, str], [count, int])
 
-    result: str = ""
-    old_len: int = len(old)
-    i, length = 0, len(text)
-    replace_all = count < 0
+    length = len(text)
+    if count < 0 or count > length + 1:
+        count = length + 1
+
+    result = StringBuilder()
+
+    if isinstance(old, AhoCorasick):
+        i = 0
+        if count > 0:
+            for match_start, match_end in old.iter_matches(text, 0, length):
+                result.append(text[i: match_start])
+                result.append(new)
+                i = match_end
+                count -= 1
+                if count == 0:
+                    break
+        result.append(text[i:])
+        return result.build()
+
+    verify_type([old, str])
+
+    # special case for empty strings, insert new around every character
+    if not old:
+        for i in range(count):
+            result.append(new)
+            if i < length:
+                result.append(text[i])
+        result.append(text[count:])
+        return result.build()
 
-    while i < length:
-        if old != text[i: i + old_len]:
-            result += text[i]
-            i += 1
-            continue  # match not found
-        if count > 0 or replace_all:
-            result += new
-            i += old_len
+    old_len: int = len(old)
+    i = 0
+    if count > 0:
+        for pos in iter_search(text, old, 0, length):
+            # copy the unchanged run before the match as a single slice
+            result.append(text[i: pos])
+            result.append(new)
+            i = pos + old_len
             count -= 1
-        else:
-            result += text[i]
-            i += 1
-    return result
+            if count == 0:
+                break
+    result.append(text[i:])
+    return result.build()
 
 
 LEFTSTRIP = 0
@@ -802,82 +1125,81 @@ def strip(text: str, chars: str | None = None) -> str:
         return do_argstrip(text, BOTHSTRIP, chars)
 
 
-def do_split(text: str, split_type: int, maxsplit: int = -1) -> list[str]:
-    if split_type == LEFTSTRIP:
-        text = lstrip(text)
-    else:
-        text = rstrip(text)
-
+def do_split(text: str, split_type: int, maxsplit: int = -1) -> Iterator[str]:
+    # fields are yielded right to left for RIGHSTRIP
+    spaces = ctype_chars[CTF_SPACE]
     length = len(text)
-    indexes: list[int] = []
-    do_max_split = maxsplit < 0
+    if maxsplit < 0:
+        maxsplit = length
 
     if split_type == LEFTSTRIP:
-        for i in range(length - 1):
-            if isspace(text[i]) and (maxsplit > 0 or do_max_split):
-                indexes.append(i)
-                if not isspace(text[i + 1]):
-                    maxsplit -= 1
-    else:
-        for j in range(length - 1, -1, -1):
-            if isspace(text[j]) and (maxsplit > 0 or do_max_split):
-                indexes.append(j)
-                if not isspace(text[j - 1]):
-                    maxsplit -= 1
-
-    res: str = ""
-    result: list[str] = []
-    for idx in range(length):
-        if idx in indexes:
-            result.append(res)
-            res = ""  # clear
-        else:
-            res += text[idx]
-    result.append(res)
-
-    # removing all whitespace
-    result = [x for x in result if x != ""]
-    # removing extra whitespaces within
-    if split_type == LEFTSTRIP:
-        return [lstrip(x) for x in result]
+        i = 0
+        while maxsplit > 0:
+            while i < length and text[i] in spaces:
+                i += 1
+            if i == length:
+                break
+            j = i
+            while i < length and text[i] not in spaces:
+                i += 1
+            yield text[j: i]
+            maxsplit -= 1
+        # the remainder keeps its inner whitespace
+        while i < length and text[i] in spaces:
+            i += 1
+        if i < length:
+            yield text[i:]
     else:
-        return [rstrip(x) for x in result]
+        j = length
+        while maxsplit > 0:
+            while j > 0 and text[j - 1] in spaces:
+                j -= 1
+            if j == 0:
+                break
+            i = j
+            while j > 0 and text[j - 1] not in spaces:
+                j -= 1
+            yield text[j: i]
+            maxsplit -= 1
+        # the remainder keeps its inner whitespace
+        while j > 0 and text[j - 1] in spaces:
+            j -= 1
+        if j > 0:
+            yield text[:j]
 
 
-def do_argsplit(text: str, split_type: int, sep: str, maxsplit: int = -1) -> list[str]:
+def do_argsplit(text: str, split_type: int, sep: str, maxsplit: int = -1) -> Iterator[str]:
+    # fields are yielded right to left for RIGHSTRIP
     sep_len = len(sep)
     length = len(text)
-    indexes: list[int] = []
-    do_max_split = maxsplit < 0
 
+    # stop searching as soon as maxsplit is used up
     if split_type == LEFTSTRIP:
-        for i in range(length):
-            if sep == text[i: i + sep_len] and (maxsplit > 0 or do_max_split):
-                indexes.append(i)
+        i = 0
+        if maxsplit != 0:
+            for pos in iter_search(text, sep, 0, length):
+                yield text[i: pos]
+                i = pos + sep_len
                 maxsplit -= 1
+                if maxsplit == 0:
+                    break
+        yield text[i:]
     else:
-        for j in range(length - 1, -1, -1):
-            if sep == text[j - (sep_len - 1): j + 1] and (maxsplit > 0 or do_max_split):
-                indexes.append(j - (sep_len - 1))
+        j = length
+        if maxsplit != 0:
+            for pos in iter_rsearch(text, sep, 0, length):
+                yield text[pos + sep_len: j]
+                j = pos
                 maxsplit -= 1
+                if maxsplit == 0:
+                    break
+        yield text[:j]
 
-    idx: int = 0
-    res: str = ""
-    result: list[str] = []
-    while idx < length:
-        if idx in indexes:
-            result.append(res)
-            res = ""  # clear
-            idx += sep_len
-        else:
-            res += text[idx]
-            idx += 1
-    result.append(res)
-    return result
 
+def isplit(text: str, sep: str | None = None, maxsplit: int = -1) -> Iterator[str]:
+    """Return an iterator over the words in the string, using sep as the delimiter string.
 
-def split(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
-    """Return a list of the words in the string, using sep as the delimiter string.
+    Words are produced lazily, from left to right, as slices of the string.
 
     sep
         The delimiter according which to split the string.
@@ -901,8 +1223,10 @@ def split(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
         return do_argsplit(text, LEFTSTRIP, sep, maxsplit)
 
 
-def rsplit(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
-    """Return a list of the words in the string, using sep as the delimiter string.
+def irsplit(text: str, sep: str | None = None, maxsplit: int = -1) -> Iterator[str]:
+    """Return an iterator over the words in the string, using sep as the delimiter string.
+
+    Words are produced lazily, from right to left, as slices of the string.
 
     sep
         The delimiter according which to split the string.
@@ -924,3 +1248,229 @@ def rsplit(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
         return do_split(text, RIGHSTRIP, maxsplit)
     else:
         return do_argsplit(text, RIGHSTRIP, sep, maxsplit)
+
+
+def split(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
+    """Return a list of the words in the string, using sep as the delimiter string.
+
+    sep
+        The delimiter according which to split the string.
+        None (the default value) means split according to any whitespace,
+        and discard empty strings from the result.
+    maxsplit
+        Maximum number of splits to do.
+        -1 (the default value) means no limit.
+    """
+    return list(isplit(text, sep, maxsplit))
+
+
+def rsplit(text: str, sep: str | None = None, maxsplit: int = -1) -> list[str]:
+    """Return a list of the words in the string, using sep as the delimiter string.
+
+    sep
+        The delimiter according which to split the string.
+        None (the default value) means split according to any whitespace,
+        and discard empty strings from the result.
+    maxsplit
+        Maximum number of splits to do.
+        -1 (the default value) means no limit.
+    """
+    result = list(irsplit(text, sep, maxsplit))
+    result.reverse()
+    return result
+
+
+__all__.extend(["isplitlines_stream", "isplit_stream"])
+
+# * Note: these aren't string methods, they split the text read from a
+# file object in fixed-size chunks so that memory doesn't grow with it.
+
+DEFAULT_CHUNKSIZE = 1 << 16
+
+
+def read_chunks(stream: IO[str] | IO[bytes], chunksize: int,
+                encoding: str, errors: str) -> Iterator[str]:
+    "Yield the text of stream in chunks, decoding it if the stream is binary."
+
+    decoder = None
+    while True:
+        chunk = stream.read(chunksize)
+        if not chunk:
+            break
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = getincrementaldecoder(encoding)(errors)
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        chunk = decoder.decode(b"", final=True)
+        if chunk:
+            yield chunk
+
+
+def verify_stream(stream: IO[str] | IO[bytes], chunksize: int) -> None:
+    "Raise an error if stream isn't readable or chunksize isn't positive."
+
+    if not hasattr(stream, "read"):
+        raise TypeError(
+            f"expected a readable file object, not {type(stream).__name__}")
+    verify_type([chunksize, int])
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+
+def do_splitlines_stream(chunks: Iterator[str], keepends: bool) -> Iterator[str]:
+    line_breaks = "\n\r\v\f"
+
+    pending: list[str] = []  # pieces of the unterminated line
+    carry = ""
+    while True:
+        chunk = next(chunks, None)
+        if chunk is None:
+            if not carry:
+                break
+            text, carry = carry, ""
+        else:
+            text = carry + chunk
+            carry = ""
+            # hold back a trailing "\r", it may be followed by "\n"
+            if text[-1] == "\r":
+                text, carry = text[:-1], "\r"
+
+        for line in do_splitlines(text, True):
+            if line[-1] not in line_breaks:
+                pending.append(line)
+                continue
+            if pending:
+                pending.append(line)
+                line = "".join(pending)
+                pending.clear()
+            if keepends:
+                yield line
+            elif line[-2:] == "\r\n":
+                yield line[:-2]
+            else:
+                yield line[:-1]
+
+    if pending:
+        yield "".join(pending)
+
+
+def do_split_stream(chunks: Iterator[str], maxsplit: int) -> Iterator[str]:
+    spaces = ctype_chars[CTF_SPACE]
+
+    pending: list[str] = []  # pieces of the word being read
+    for chunk in chunks:
+        i, length = 0, len(chunk)
+        while i < length and maxsplit != 0:
+            if not pending:
+                while i < length and chunk[i] in spaces:
+                    i += 1
+                if i == length:
+                    break
+            j = i
+            while i < length and chunk[i] not in spaces:
+                i += 1
+            pending.append(chunk[j: i])
+            if i == length:
+                break  # the word may continue in the next chunk
+            yield "".join(pending)
+            pending.clear()
+            maxsplit -= 1
+
+        if maxsplit == 0:
+            # the remainder keeps its inner whitespace
+            pending.append(chunk[i:])
+            pending.extend(chunks)
+            remainder = do_strip("".join(pending), LEFTSTRIP)
+            if remainder:
+                yield remainder
+            return
+
+    if pending:
+        yield "".join(pending)
+
+
+def do_argsplit_stream(chunks: Iterator[str], sep: str, maxsplit: int) -> Iterator[str]:
+    sep_len = len(sep)
+
+    pending: list[str] = []  # pieces of the field being read
+    tail = ""  # end of the field, where a separator may begin
+    for chunk in chunks:
+        buffer = tail + chunk
+        length = len(buffer)
+        i = 0
+        if maxsplit != 0:
+            for pos in iter_search(buffer, sep, 0, length):
+                pending.append(buffer[i: pos])
+                yield "".join(pending)
+                pending.clear()
+                i = pos + sep_len
+                maxsplit -= 1
+                if maxsplit == 0:
+                    break
+
+        if maxsplit == 0:
+            pending.append(buffer[i:])
+            pending.extend(chunks)
+            yield "".join(pending)
+            return
+
+        # keep the last sep_len - 1 characters, a separator may span chunks
+        keep = max(i, length - sep_len + 1)
+        pending.append(buffer[i: keep])
+        tail = buffer[keep:]
+
+    pending.append(tail)
+    yield "".join(pending)
+
+
+def isplitlines_stream(stream: IO[str] | IO[bytes], keepends: bool = False, *,
+                       chunksize: int = DEFAULT_CHUNKSIZE,
+                       encoding: str = "utf-8", errors: str = "strict") -> Iterator[str]:
+    """Return an iterator over the lines read from a file object, breaking at line boundaries.
+
+    The stream is read chunksize characters (or bytes) at a time, binary
+    streams are decoded using encoding and errors. Memory use is bounded
+    by the chunk size and the longest line, not by the size of the stream.
+
+    Line breaks are not included in the resulting lines unless keepends is given and true.
+    """
+    verify_stream(stream, chunksize)
+    verify_type([keepends, bool], [encoding, str], [errors, str])
+
+    chunks = read_chunks(stream, chunksize, encoding, errors)
+    return do_splitlines_stream(chunks, keepends)
+
+
+def isplit_stream(stream: IO[str] | IO[bytes], sep: str | None = None, maxsplit: int = -1, *,
+                  chunksize: int = DEFAULT_CHUNKSIZE,
+                  encoding: str = "utf-8", errors: str = "strict") -> Iterator[str]:
+    """Return an iterator over the words read from a file object, using sep as the delimiter string.
+
+    The stream is read chunksize characters (or bytes) at a time, binary
+    streams are decoded using encoding and errors. Memory use is bounded
+    by the chunk size and the longest word, not by the size of the stream.
+
+    sep
+        The delimiter according which to split the stream.
+        None (the default value) means split according to any whitespace,
+        and discard empty strings from the result.
+    maxsplit
+        Maximum number of splits to do.
+        -1 (the default value) means no limit.
+    """
+    verify_stream(stream, chunksize)
+    verify_type([maxsplit, int], [encoding, str], [errors, str])
+    if sep is not None:
+        verify_type([sep, str])
+
+    if sep == '':
+        raise ValueError("empty separator")
+
+    chunks = read_chunks(stream, chunksize, encoding, errors)
+    if sep is None:
+        return do_split_stream(chunks, maxsplit)
+    else:
+        return do_argsplit_stream(chunks, sep, maxsplit)
@@ -1,5 +1,5 @@
 from sys import getdefaultencoding
-from typing import Iterable, LiteralString, Self
+from typing import Iterable, Iterator, LiteralString, Self
 
 from _types import FormatMapMapping, ReadableBuffer, TranslateTable
 from string_methods import *
@@ -341,6 +341,14 @@ class Str:
         """
         return splitlines(self.__data, keepends)
 
+    def isplitlines(self, /, keepends: bool = False) -> Iterator[str]:
+        """Return an iterator over the lines in the string, breaking at line boundaries.
+
+        Lines are produced lazily, one at a time, as slices of the string.
+        Line breaks are not included in the resulting lines unless keepends is given and true.
+        """
+        return isplitlines(self.__data, keepends)
+
     def removeprefix(self, /, prefix: Self | str) -> Self:
         """Return a str with the given prefix string removed if present.
 
@@ -357,7 +365,8 @@ class Str:
         """
         return self.__class__(removesuffix(self.__data, self.__cast(suffix)))
 
-    def startswith(self, /, prefix: Self | str, start: int = 0, end: int | None = None) -> bool:
+    def startswith(self, /, prefix: Self | str | tuple[str, ...] | AhoCorasick,
+                   start: int = 0, end: int | None = None) -> bool:
         """Return True if self starts with the specified prefix, False otherwise.
 
         With optional start, test self beginning at that position.
@@ -366,7 +375,8 @@ class Str:
         """
         return startswith(self.__data, self.__cast(prefix), start, end)
 
-    def endswith(self, /, suffix: Self | str, start: int = 0, end: int | None = None) -> bool:
+    def endswith(self, /, suffix: Self | str | tuple[str, ...] | AhoCorasick,
+                 start: int = 0, end: int | None = None) -> bool:
         """Return True if self ends with the specified suffix, False otherwise.
 
         With optional start, test self beginning at that position.
@@ -375,7 +385,7 @@ class Str:
         """
         return endswith(self.__data, self.__cast(suffix), start, end)
 
-    def find(self, /, sub: Self | str, start: int = 0, end: int | None = None) -> int:
+    def find(self, /, sub: Self | str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
         """Return the lowest index in self where substring sub is found,
         such that sub is contained within self[start:end].
         Optional arguments start and end are interpreted as in slice notation.
@@ -394,7 +404,7 @@ class Str:
         """
         return rfind(self.__data, self.__cast(sub), start, end)
 
-    def index(self, /, sub: Self | str, start: int = 0, end: int | None = None) -> int:
+    def index(self, /, sub: Self | str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
         """Return the lowest index in self where substring sub is found,
         such that sub is contained within self[start:end].
 
@@ -414,7 +424,7 @@ class Str:
         """
         return rindex(self.__data, self.__cast(sub), start, end)
 
-    def count(self, /, sub: Self | str, start: int = 0, end: int | None = None) -> int:
+    def count(self, /, sub: Self | str | AhoCorasick, start: int = 0, end: int | None = None) -> int:
         """Return the number of non-overlapping occurrences of substring sub in string self[start:end].
 
         Optional arguments start and end are interpreted as in slice notation.
@@ -431,7 +441,7 @@ class Str:
         """
         return self.__class__(join(self.__data, iterable))
 
-    def replace(self, /, old: Self | str, new: Self | str, maxsplit: int = -1) -> Self:
+    def replace(self, /, old: Self | str | AhoCorasick, new: Self | str, maxsplit: int = -1) -> Self:
         """Return a copy with all occurrences of substring old replaced by new.
 
         count
@@ -488,3 +498,33 @@ class Str:
             -1 (the default value) means no limit.
         """
         return rsplit(self.__data, self.__cast(sep), maxsplit)  # type: ignore
+
+    def isplit(self, /, sep: Self | str | None = None, maxsplit: int = -1) -> Iterator[str]:
+        """Return an iterator over the words in the string, using sep as the delimiter string.
+
+        Words are produced lazily, from left to right, as slices of the string.
+
+        sep
+            The delimiter according which to split the string.
+            None (the default value) means split according to any whitespace,
+            and discard empty strings from the result.
+        maxsplit
+            Maximum number of splits to do.
+            -1 (the default value) means no limit.
+        """
+        return isplit(self.__data, self.__cast(sep), maxsplit)  # type: ignore
+
+    def irsplit(self, /, sep: Self | str | None = None, maxsplit: int = -1) -> Iterator[str]:
+        """Return an iterator over the words in the string, using sep as the delimiter string.
+
+        Words are produced lazily, from right to left, as slices of the string.
+
+        sep
+            The delimiter according which to split the string.
+            None (the default value) means split according to any whitespace,
+            and discard empty strings from the result.
+        maxsplit
+            Maximum number of splits to do.
+            -1 (the default value) means no limit.
+        """
+        return irsplit(self.__data, self.__cast(sep), maxsplit)  # type: ignore